@@ -0,0 +1,7 @@
+"""
+Tooling to discover, run and measure the advent of code solutions in this repository
+"""
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SOLUTIONS_DIR = REPO_ROOT / "solutions"
@@ -0,0 +1,187 @@
+"""
+Command line entry point, run from the repository root with ``python -m aoctools``
+"""
+import argparse
+import time
+from pathlib import Path
+
+from aoctools.benchmark import (
+    benchmark_all,
+    check_generators,
+    find_regressions,
+    format_benchmarks,
+    load_baseline,
+    save_baseline,
+    select_baseline,
+)
+from aoctools.cache import AnswerCache
+from aoctools.discovery import discover_solutions
+from aoctools.importtime import format_startup, measure_all
+from aoctools.inputs import fetch_into_store
+from aoctools.profiling import DEFAULT_PROFILE_DIR
+from aoctools.runner import format_results, record_answers, run_all, verify
+
+
+def add_selection_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("-y", "--year", type=int, nargs="*", help="only these years")
+    parser.add_argument("-d", "--day", type=int, nargs="*", help="only these days")
+
+
+def run_command(args: argparse.Namespace) -> int:
+    solutions = discover_solutions(years=args.year, days=args.day, include_scripts=args.scripts)
+    wall_start = time.perf_counter()
+    cache = None if args.no_cache else AnswerCache(max_entries=args.cache_size)
+    results = run_all(solutions, max_workers=args.workers, cache=cache, profile_dir=args.profile)
+    wall_time = time.perf_counter() - wall_start
+    if args.verify:
+        verify(results)
+    print(format_results(results, verified=args.verify))
+    print(
+        f"\n{len(results)} parts of {len(solutions)} puzzles "
+        f"({sum(r.cached for r in results)} cached) in {wall_time:.2f}s wall time "
+        f"({sum(r.wall_time for r in results):.2f}s serial, "
+        f"{sum(r.cpu_time for r in results):.2f}s cpu)"
+    )
+    if args.verify:
+        checks = [result.correct for result in results]
+        print(
+            f"verified: {checks.count(True)} ok, {checks.count(False)} wrong, "
+            f"{checks.count(None)} unknown"
+        )
+    if args.record:
+        print(f"recorded {record_answers(results)} new answers")
+    return int(not all(result.ok and result.correct is not False for result in results))
+
+
+def bench_command(args: argparse.Namespace) -> int:
+    solutions = discover_solutions(years=args.year, days=args.day, include_scripts=True)
+    results = benchmark_all(
+        solutions,
+        warmup=args.warmup,
+        repeat=args.repeat,
+        max_workers=args.workers,
+        sizes=args.sizes,
+        seed=args.seed,
+    )
+    baseline = None
+    if args.compare:
+        baseline = select_baseline(load_baseline(args.compare), args.year, args.day, args.sizes)
+    print(format_benchmarks(results, baseline))
+    if args.save:
+        save_baseline(results, args.save)
+    if baseline is None:
+        return 0
+    regressions = find_regressions(results, baseline, threshold=args.threshold)
+    for regression in regressions:
+        if regression.error is not None:
+            print(f"REGRESSION {regression.key}: {regression.error}")
+            continue
+        print(
+            f"REGRESSION {regression.key}: {regression.baseline:.4f}s -> "
+            f"{regression.current:.4f}s ({regression.slowdown:+.1f}%)"
+        )
+    return int(bool(regressions))
+
+
+def check_command(args: argparse.Namespace) -> int:
+    results = check_generators(
+        years=args.year, days=args.day, sizes=args.sizes, seed=args.seed, max_workers=args.workers
+    )
+    print(format_benchmarks(results))
+    errors = sum(result.error is not None for result in results)
+    print(f"\n{len(results) - errors} parts ran on generated inputs, {errors} failed")
+    return int(bool(errors))
+
+
+def startup_command(args: argparse.Namespace) -> int:
+    solutions = discover_solutions(years=args.year, days=args.day, include_scripts=True)
+    reports = measure_all(solutions, max_workers=args.workers)
+    print(format_startup(reports, top=args.top))
+    return 0
+
+
+def fetch_command(args: argparse.Namespace) -> int:
+    for year in args.year:
+        for day in args.day:
+            fetch_into_store(year, day)
+            print(f"stored input and examples of {year}/day{day}")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="aoctools", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run all solutions in parallel")
+    add_selection_arguments(run_parser)
+    run_parser.add_argument("-w", "--workers", type=int, help="number of worker processes")
+    run_parser.add_argument(
+        "--scripts", action="store_true",
+        help="also run script-style solutions, their answer is what they print",
+    )
+    run_parser.add_argument(
+        "--profile", type=Path, nargs="?", const=DEFAULT_PROFILE_DIR,
+        help=f"write cProfile, tracemalloc and peak RSS reports (default: {DEFAULT_PROFILE_DIR})",
+    )
+    run_parser.add_argument("--no-cache", action="store_true", help="ignore cached answers")
+    run_parser.add_argument(
+        "--verify", action="store_true",
+        help="check the answers against the known answers in answers.json, fail when one differs",
+    )
+    run_parser.add_argument(
+        "--record", action="store_true",
+        help="store the answers of parts without a known answer in answers.json",
+    )
+    run_parser.add_argument(
+        "--cache-size", type=int, default=1024, help="maximum number of cached answers"
+    )
+    run_parser.set_defaults(func=run_command)
+
+    bench_parser = subparsers.add_parser("bench", help="benchmark all solutions")
+    add_selection_arguments(bench_parser)
+    bench_parser.add_argument("--warmup", type=int, default=1, help="untimed runs before timing")
+    bench_parser.add_argument("--repeat", type=int, default=5, help="number of timed runs")
+    bench_parser.add_argument("-w", "--workers", type=int, default=1, help="worker processes")
+    bench_parser.add_argument("--save", type=Path, help="store the results as a JSON baseline")
+    bench_parser.add_argument("--compare", type=Path, help="compare to a JSON baseline")
+    bench_parser.add_argument(
+        "--threshold", type=float, default=10.0,
+        help="fail when a median is more than this percentage slower than the baseline",
+    )
+    bench_parser.add_argument(
+        "--sizes", type=int, nargs="+",
+        help="time the parts on generated inputs of these sizes instead of the puzzle input",
+    )
+    bench_parser.add_argument("--seed", type=int, default=0, help="seed of generated inputs")
+    bench_parser.set_defaults(func=bench_command)
+
+    check_parser = subparsers.add_parser(
+        "check", help="run the parts of every solution with an input generator on generated inputs"
+    )
+    add_selection_arguments(check_parser)
+    check_parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100], help="sizes of the generated inputs"
+    )
+    check_parser.add_argument("--seed", type=int, default=0, help="seed of generated inputs")
+    check_parser.add_argument("-w", "--workers", type=int, help="number of worker processes")
+    check_parser.set_defaults(func=check_command)
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="report the import time of every solution (python -X importtime)"
+    )
+    add_selection_arguments(startup_parser)
+    startup_parser.add_argument("--top", type=int, default=3, help="heaviest imports to show")
+    startup_parser.add_argument("-w", "--workers", type=int, help="parallel interpreters")
+    startup_parser.set_defaults(func=startup_command)
+
+    fetch_parser = subparsers.add_parser("fetch", help="fetch puzzles into the input store")
+    fetch_parser.add_argument("-y", "--year", type=int, nargs="+", required=True)
+    fetch_parser.add_argument("-d", "--day", type=int, nargs="+", required=True)
+    fetch_parser.set_defaults(func=fetch_command)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
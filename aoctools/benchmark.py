@@ -0,0 +1,233 @@
+"""
+Benchmark the solutions with warmup and repeated runs, and compare against a stored baseline
+"""
+import json
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from aoctools.discovery import Solution, discover_solutions
+from aoctools.generators import GENERATORS, generate
+from aoctools.runner import bind_part, init_worker
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of repeated runs of a single part function or script"""
+    key: str
+    times: list[float] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times) if self.times else float("nan")
+
+    @property
+    def p95(self) -> float:
+        if len(self.times) < 2:
+            return self.median
+        return statistics.quantiles(self.times, n=20, method="inclusive")[-1]
+
+
+@dataclass
+class Regression:
+    """A benchmark that got slower than allowed compared to the baseline, failed or went missing"""
+    key: str
+    baseline: float
+    current: float
+    error: str | None = None
+
+    @property
+    def slowdown(self) -> float:
+        return (self.current / self.baseline - 1) * 100
+
+
+def benchmark_key(solution: Solution, part: str, size: int | None = None) -> str:
+    key = f"{solution}:{part}"
+    return key if size is None else f"{key}@{size}"
+
+
+def benchmark(
+    solution: Solution,
+    part: str,
+    warmup: int = 1,
+    repeat: int = 5,
+    size: int | None = None,
+    seed: int = 0,
+) -> BenchmarkResult:
+    """
+    Time a part, or the whole script of a script-style solution, after warming it up
+
+    With a size, the part is timed on a generated input of that size instead of the puzzle input.
+    """
+    result = BenchmarkResult(benchmark_key(solution, part, size))
+    try:
+        input_data = None if size is None else generate(solution.year, solution.day, size, seed)
+        run = bind_part(solution, part, input_data)
+        for _ in range(warmup):
+            run()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            result.times.append(time.perf_counter() - start)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def benchmark_all(
+    solutions: Iterable[Solution],
+    warmup: int = 1,
+    repeat: int = 5,
+    max_workers: int = 1,
+    sizes: Iterable[int] | None = None,
+    seed: int = 0,
+) -> list[BenchmarkResult]:
+    """
+    Benchmark every part of every solution, script-style solutions are timed as a whole
+
+    With sizes, the parts of every solution with an input generator are timed on generated inputs
+    of each size instead, to show how their runtime scales. A single worker is used by default so
+    that benchmarks do not compete for the same cores.
+    """
+    if sizes is None:
+        tasks = [(solution, part, None) for solution in solutions for part in solution.run_parts]
+    else:
+        tasks = [
+            (solution, part, size)
+            for solution in solutions
+            if (solution.year, solution.day) in GENERATORS
+            for part in solution.parts
+            for size in sizes
+        ]
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker) as executor:
+        futures = [
+            executor.submit(benchmark, solution, part, warmup, repeat, size, seed)
+            for solution, part, size in tasks
+        ]
+        return [future.result() for future in futures]
+
+
+def check_generators(
+    years: Iterable[int] | None = None,
+    days: Iterable[int] | None = None,
+    sizes: Iterable[int] = (10, 100),
+    seed: int = 0,
+    max_workers: int | None = None,
+) -> list[BenchmarkResult]:
+    """
+    Run every part of the solution of every registered generator once on inputs of each size
+
+    A generator without a solution that exposes part functions is reported as an error.
+    """
+    years = set(years) if years else None
+    days = set(days) if days else None
+    solutions = {
+        (solution.year, solution.day): solution
+        for solution in discover_solutions(years, days, include_scripts=True)
+    }
+    results, tasks = [], []
+    for year, day in sorted(GENERATORS):
+        if (years and year not in years) or (days and day not in days):
+            continue
+        solution = solutions.get((year, day))
+        if solution is None or solution.is_script:
+            results.append(BenchmarkResult(f"{year}/day{day}", error="no part functions to check"))
+            continue
+        tasks.extend((solution, part, size) for part in solution.parts for size in sizes)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker) as executor:
+        futures = [
+            executor.submit(benchmark, solution, part, 0, 1, size, seed)
+            for solution, part, size in tasks
+        ]
+        return results + [future.result() for future in futures]
+
+
+def save_baseline(results: list[BenchmarkResult], path: Path):
+    """Store the benchmark results as a JSON baseline"""
+    baseline = {
+        result.key: {**asdict(result), "median": result.median, "p95": result.p95}
+        for result in results
+        if result.error is None
+    }
+    path.write_text(json.dumps(baseline, indent=2))
+
+
+def load_baseline(path: Path) -> dict[str, BenchmarkResult]:
+    """Read a JSON baseline written by save_baseline"""
+    return {
+        key: BenchmarkResult(key, times=stored["times"])
+        for key, stored in json.loads(path.read_text()).items()
+    }
+
+
+def select_baseline(
+    baseline: dict[str, BenchmarkResult],
+    years: Iterable[int] | None = None,
+    days: Iterable[int] | None = None,
+    sizes: Iterable[int] | None = None,
+) -> dict[str, BenchmarkResult]:
+    """Keep the baseline benchmarks that a run of these years, days and sizes would time"""
+    years = set(years) if years else None
+    days = set(days) if days else None
+    sizes = set(sizes) if sizes else None
+    selected = {}
+    for key, result in baseline.items():
+        solution, _, part = key.partition(":")
+        year, _, day = solution.partition("/day")
+        size = part.partition("@")[2]
+        if (years and int(year) not in years) or (days and int(day) not in days):
+            continue
+        if (sizes is None and size) or (sizes is not None and (not size or int(size) not in sizes)):
+            continue
+        selected[key] = result
+    return selected
+
+
+def find_regressions(
+    results: list[BenchmarkResult], baseline: dict[str, BenchmarkResult], threshold: float
+) -> list[Regression]:
+    """
+    Return the benchmarks whose median is more than threshold percent slower than baseline
+
+    A benchmark that raised, or a baseline benchmark that is missing from the results, is a
+    regression as well.
+    """
+    regressions = []
+    for result in results:
+        baseline_median = baseline[result.key].median if result.key in baseline else float("nan")
+        if result.error is not None:
+            regressions.append(Regression(result.key, baseline_median, float("nan"), result.error))
+            continue
+        if result.key not in baseline:
+            continue
+        regression = Regression(result.key, baseline_median, result.median)
+        if regression.slowdown > threshold:
+            regressions.append(regression)
+    keys = {result.key for result in results}
+    regressions.extend(
+        Regression(key, stored.median, float("nan"), "missing from the results")
+        for key, stored in baseline.items()
+        if key not in keys
+    )
+    return regressions
+
+
+def format_benchmarks(
+    results: list[BenchmarkResult], baseline: dict[str, BenchmarkResult] | None = None
+) -> str:
+    """Format the benchmark results as a table, with the change to the baseline if given"""
+    baseline = baseline or {}
+    lines = [f"{'benchmark':<32} {'median [s]':>11} {'p95 [s]':>11} {'change':>8}"]
+    for result in results:
+        if result.error is not None:
+            lines.append(f"{result.key:<32} ERROR {result.error}")
+            continue
+        change = ""
+        if result.key in baseline:
+            change = f"{(result.median / baseline[result.key].median - 1) * 100:+.1f}%"
+        lines.append(f"{result.key:<32} {result.median:>11.4f} {result.p95:>11.4f} {change:>8}")
+    return "\n".join(lines)
@@ -0,0 +1,110 @@
+"""
+On-disk answer cache keyed by input content hash, solver source hash and part
+"""
+import ast
+import hashlib
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from aoctools import REPO_ROOT
+from aoctools.discovery import Solution
+
+DEFAULT_CACHE_PATH = REPO_ROOT / ".aoctools_cache" / "answers.pickle"
+PACKAGE_NAME = "aoctools"
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+class CacheKey(NamedTuple):
+    input_digest: str
+    source_digest: str
+    part: str
+
+
+class CachedAnswer(NamedTuple):
+    answer: Any
+    wall_time: float
+    cpu_time: float
+
+
+def package_module_path(module_name: str) -> Path | None:
+    """Source file of an aoctools module or package, None for names that are not one"""
+    parts = module_name.split(".")
+    if parts[0] != PACKAGE_NAME:
+        return None
+    module_path = PACKAGE_DIR.joinpath(*parts[1:])
+    for path in (module_path / "__init__.py", module_path.with_suffix(".py")):
+        if path.is_file():
+            return path
+    return None
+
+
+def imported_package_modules(path: Path) -> set[Path]:
+    """Source files of the aoctools modules that a module imports, directly or indirectly"""
+    found, pending = set(), [path]
+    while pending:
+        for node in ast.walk(ast.parse(pending.pop().read_bytes())):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module, *(f"{node.module}.{alias.name}" for alias in node.names)]
+            else:
+                continue
+            for name in names:
+                parts = name.split(".")
+                for depth in range(1, len(parts) + 1):  # importing a module runs its packages
+                    module_path = package_module_path(".".join(parts[:depth]))
+                    if module_path is not None and module_path not in found:
+                        found.add(module_path)
+                        pending.append(module_path)
+    return found
+
+
+def source_digest(solution: Solution) -> str:
+    """sha256 of the solution module source and of the sources of the aoctools modules it uses"""
+    digest = hashlib.sha256(solution.path.read_bytes())
+    for path in sorted(imported_package_modules(solution.path)):
+        digest.update(path.relative_to(PACKAGE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    """Least recently used answer cache that holds at most max_entries answers"""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, max_entries: int = 1024):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.entries: OrderedDict[CacheKey, CachedAnswer] = OrderedDict()
+        if self.path.exists():
+            with open(self.path, "rb") as f:
+                self.entries = pickle.load(f)
+        self._evict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self.entries
+
+    def get(self, key: CacheKey) -> CachedAnswer | None:
+        """Return the cached answer and mark it as most recently used"""
+        if key not in self.entries:
+            return None
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key: CacheKey, cached_answer: CachedAnswer):
+        self.entries[key] = cached_answer
+        self.entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "wb") as f:
+            pickle.dump(self.entries, f)
@@ -0,0 +1,95 @@
+"""
+Find the solution modules and the part functions they expose without importing them
+"""
+import ast
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable, Iterator
+
+from aoctools import SOLUTIONS_DIR
+
+PART_FUNCTIONS = ("part_1", "part_2", "part_1_and_2")
+SCRIPT_PART = "__main__"  # stands in for the part functions of script-style solutions
+DAY_PATTERN = re.compile(r"day(?P<day>\d{1,2})\.py")
+
+
+@dataclass(frozen=True, order=True)
+class Solution:
+    """A single day solution module"""
+    year: int
+    day: int
+    path: Path
+    parts: tuple[str, ...]
+
+    def __str__(self):
+        return f"{self.year}/day{self.day}"
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc{self.year}_day{self.day}"
+
+    @property
+    def is_script(self) -> bool:
+        """Script-style solutions only do their work in the ``__main__`` block"""
+        return not self.parts
+
+    @property
+    def run_parts(self) -> tuple[str, ...]:
+        """Parts to run, the ``__main__`` block for script-style solutions"""
+        return self.parts or (SCRIPT_PART,)
+
+
+def defined_part_functions(path: Path) -> tuple[str, ...]:
+    """Return the part functions defined at the top level of a module, in PART_FUNCTIONS order"""
+    tree = ast.parse(path.read_text(), filename=str(path))
+    defined = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+    return tuple(name for name in PART_FUNCTIONS if name in defined)
+
+
+def iter_solution_paths(solutions_dir: Path = SOLUTIONS_DIR) -> Iterator[tuple[int, int, Path]]:
+    """Yield (year, day, path) for both the ``YYYY/dayN/dayN.py`` and ``YYYY/dayN.py`` layouts"""
+    for year_dir in solutions_dir.iterdir():
+        if not (year_dir.is_dir() and year_dir.name.isdigit()):
+            continue
+        for path in (*year_dir.glob("day*.py"), *year_dir.glob("day*/day*.py")):
+            if match := DAY_PATTERN.fullmatch(path.name):
+                yield int(year_dir.name), int(match["day"]), path
+
+
+def discover_solutions(
+    years: Iterable[int] | None = None,
+    days: Iterable[int] | None = None,
+    include_scripts: bool = False,
+    solutions_dir: Path = SOLUTIONS_DIR,
+) -> list[Solution]:
+    """Discover all solutions, optionally filtered on years and days"""
+    years = set(years) if years else None
+    days = set(days) if days else None
+    solutions = []
+    for year, day, path in iter_solution_paths(solutions_dir):
+        if (years and year not in years) or (days and day not in days):
+            continue
+        solution = Solution(year, day, path, defined_part_functions(path))
+        if solution.is_script and not include_scripts:
+            continue
+        solutions.append(solution)
+    return sorted(solutions)
+
+
+def load_module(solution: Solution) -> ModuleType:
+    """Import a solution module by path, reusing it when it was imported before"""
+    if solution.module_name in sys.modules:
+        return sys.modules[solution.module_name]
+    spec = importlib.util.spec_from_file_location(solution.module_name, solution.path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[solution.module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[solution.module_name]
+        raise
+    return module
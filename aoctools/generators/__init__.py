@@ -0,0 +1,29 @@
+"""
+Generators for valid, arbitrarily large puzzle inputs
+
+Every generator takes a size and a seeded ``random.Random`` and returns the input text, so the
+same (size, seed) always gives the same input. Importing this package registers the generators of
+all years.
+"""
+import random
+from typing import Callable
+
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS: dict[tuple[int, int], Generator] = {}
+
+
+def register(year: int, day: int) -> Callable[[Generator], Generator]:
+    """Register a generator for the puzzle of the given year and day"""
+    def decorator(generator: Generator) -> Generator:
+        GENERATORS[(year, day)] = generator
+        return generator
+    return decorator
+
+
+def generate(year: int, day: int, size: int, seed: int = 0) -> str:
+    """Generate an input of the given size for a puzzle, raises KeyError without a generator"""
+    return GENERATORS[(year, day)](size, random.Random(seed))
+
+
+from aoctools.generators import y2020, y2021, y2022, y2024  # noqa: E402  register generators
@@ -0,0 +1,267 @@
+"""
+Input generators for the 2020 puzzles
+"""
+import random
+import string
+
+import numpy as np
+
+from aoctools.generators import register
+
+ADJECTIVES = (
+    "bright", "clear", "dark", "dim", "dotted", "drab", "dull", "faded", "light", "mirrored",
+    "muted", "pale", "plaid", "posh", "shiny", "striped", "vibrant", "wavy",
+)
+COLORS = (
+    "aqua", "beige", "black", "blue", "bronze", "brown", "chartreuse", "coral", "crimson", "cyan",
+    "fuchsia", "gold", "gray", "green", "indigo", "lavender", "lime", "magenta", "maroon", "olive",
+    "orange", "plum", "purple", "red", "salmon", "silver", "tan", "teal", "tomato", "turquoise",
+    "violet", "white", "yellow",
+)
+
+
+@register(2020, 1)
+def expense_report(size: int, rng: random.Random) -> str:
+    """
+    Expense entries with exactly one pair and one triple summing to 2020
+
+    Fillers are all above 1420, so only the planted entries can be part of a sum to 2020.
+    """
+    pair_low = rng.randint(100, 300)
+    pair_high = 2020 - pair_low
+    triple = [rng.randint(600, 700), rng.randint(600, 700)]
+    triple.append(2020 - sum(triple))
+    fillers = [n for n in range(1421, 2020) if n != pair_high]
+    entries = [pair_low, pair_high, *triple, *rng.choices(fillers, k=max(size - 5, 0))]
+    rng.shuffle(entries)
+    return "\n".join(map(str, entries))
+
+
+@register(2020, 2)
+def password_policies(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        password = "".join(rng.choices(string.ascii_lowercase[:6], k=rng.randint(3, 20)))
+        minimum = rng.randint(1, len(password) - 1)
+        maximum = rng.randint(minimum + 1, len(password))
+        lines.append(f"{minimum}-{maximum} {rng.choice(password)}: {password}")
+    return "\n".join(lines)
+
+
+@register(2020, 3)
+def tree_map(size: int, rng: random.Random, width: int = 31) -> str:
+    return "\n".join(
+        "".join(rng.choices(".#", weights=(3, 1), k=width)) for _ in range(size)
+    )
+
+
+@register(2020, 4)
+def passports(size: int, rng: random.Random) -> str:
+    """Passports with randomly missing and invalid fields"""
+    def field_values():
+        return {
+            "byr": str(rng.randint(1900, 2010)),
+            "iyr": str(rng.randint(2005, 2025)),
+            "eyr": str(rng.randint(2015, 2035)),
+            "hgt": rng.choice((f"{rng.randint(140, 200)}cm", f"{rng.randint(50, 80)}in", "170")),
+            "hcl": rng.choice(("#", "")) + "".join(rng.choices("0123456789abcdef", k=6)),
+            "ecl": rng.choice(("amb", "blu", "brn", "gry", "grn", "hzl", "oth", "xry")),
+            "pid": "".join(rng.choices(string.digits, k=rng.choice((9, 9, 9, 10)))),
+            "cid": str(rng.randint(100, 350)),
+        }
+
+    records = []
+    for _ in range(size):
+        fields = [f"{key}:{value}" for key, value in field_values().items() if rng.random() > 0.05]
+        rng.shuffle(fields)
+        records.append("\n".join(
+            " ".join(fields[i:i + 3]) for i in range(0, len(fields), 3)
+        ))
+    return "\n\n".join(records)
+
+
+@register(2020, 5)
+def boarding_passes(size: int, rng: random.Random) -> str:
+    """
+    Boarding passes of a contiguous range of seats with a single missing seat
+
+    Planes with more than 1024 seats get more F/B row characters. There are at least 2 passes.
+    """
+    size = max(size, 2)
+    row_bits = max(7, (size + 2).bit_length() - 2)
+    n_seats = 2 ** (row_bits + 3)
+    first_seat = rng.randint(1, n_seats - size - 2)
+    missing_seat = rng.randint(first_seat + 1, first_seat + size - 1)
+    seats = [seat for seat in range(first_seat, first_seat + size + 1) if seat != missing_seat]
+    rng.shuffle(seats)
+    rows = str.maketrans("01", "FB")
+    columns = str.maketrans("01", "LR")
+    return "\n".join(
+        f"{seat >> 3:0{row_bits}b}".translate(rows) + f"{seat & 7:03b}".translate(columns)
+        for seat in seats
+    )
+
+
+@register(2020, 6)
+def customs_declarations(size: int, rng: random.Random) -> str:
+    """Declarations of size groups of one to five people"""
+    groups = []
+    for _ in range(size):
+        groups.append("\n".join(
+            "".join(rng.sample(string.ascii_lowercase, rng.randint(1, 26)))
+            for _ in range(rng.randint(1, 5))
+        ))
+    return "\n\n".join(groups)
+
+
+@register(2020, 7)
+def bag_rules(size: int, rng: random.Random) -> str:
+    """
+    Acyclic bag containment rules for size colours that include shiny gold
+
+    Beyond the 594 adjective and colour names, colours are named with a numbered word instead of
+    an adjective, such as ``c12 teal``.
+    """
+    size = max(size, 1)
+    colours = [f"{adjective} {color}" for adjective in ADJECTIVES for color in COLORS]
+    colours.remove("shiny gold")
+    colours.extend(
+        f"c{i // len(COLORS)} {COLORS[i % len(COLORS)]}" for i in range(size - 1 - len(colours))
+    )
+    colours = rng.sample(colours, size - 1)
+    colours.insert(rng.randint(len(colours) // 4, len(colours) // 2), "shiny gold")
+    rules = []
+    for i, colour in enumerate(colours):
+        n_inner = min(rng.randint(0, 4), len(colours) - i - 1)
+        inner = [colours[j] for j in rng.sample(range(i + 1, len(colours)), n_inner)]
+        if not inner:
+            rules.append(f"{colour} bags contain no other bags.")
+            continue
+        contents = []
+        for inner_colour in inner:
+            amount = rng.randint(1, 5)
+            contents.append(f"{amount} {inner_colour} bag{'s' if amount > 1 else ''}")
+        rules.append(f"{colour} bags contain {', '.join(contents)}.")
+    rng.shuffle(rules)
+    return "\n".join(rules)
+
+
+@register(2020, 8)
+def boot_code(size: int, rng: random.Random) -> str:
+    """
+    Boot code with an infinite loop that is fixed by flipping exactly one jmp
+
+    The loop is a single ``jmp`` back. Every other ``nop`` only points backwards and every other
+    ``jmp`` only forward up to the loop, so flipping any other instruction still ends in the loop.
+    There are at least 3 instructions.
+    """
+    size = max(size, 3)
+    loop_at = rng.randint(size // 2, size - 2)
+    instructions = []
+    for i in range(size):
+        if i == loop_at:
+            instructions.append(f"jmp {-rng.randint(1, i):+d}")
+            continue
+        limit = loop_at if i < loop_at else size
+        operation = rng.choices(("acc", "nop", "jmp"), weights=(3, 1, 1))[0]
+        if operation == "acc":
+            instructions.append(f"acc {rng.randint(-50, 50):+d}")
+        elif operation == "nop":
+            instructions.append(f"nop {-rng.randint(0, i):+d}")
+        else:
+            instructions.append(f"jmp {rng.randint(1, max(limit - i, 1)):+d}")
+    return "\n".join(instructions)
+
+
+@register(2020, 9)
+def xmas_numbers(size: int, rng: random.Random, preamble: int = 25) -> str:
+    """
+    XMAS numbers where every number is a sum of two of the preceding ones, except for one
+
+    The invalid number is the sum of a contiguous range. Numbers grow exponentially, so inputs
+    of more than about 10^4 numbers consist of big integers. Inputs have at least one number more
+    than the preamble, and get longer when the invalid number can only be placed after size.
+    """
+    size = max(size, preamble + 1)
+    numbers = rng.sample(range(1, 2 * preamble + 1), preamble)
+    invalid_at = rng.randint(max(preamble, size // 2), size - 1)
+    while len(numbers) < size:
+        window = numbers[-preamble:]
+        if len(numbers) == invalid_at:
+            start = rng.randint(0, len(numbers) - 3)
+            candidate = sum(numbers[start:start + rng.randint(2, 5)])
+            if candidate not in window and all(candidate - n not in window for n in window):
+                numbers.append(candidate)
+                continue
+            invalid_at += 1  # the range sum is valid, retry for the next number
+            size = max(size, invalid_at + 1)
+        first, second = rng.sample(window, 2)
+        while first == second:
+            first, second = rng.sample(window, 2)
+        numbers.append(first + second)
+    return "\n".join(map(str, numbers))
+
+
+@register(2020, 10)
+def adapters(size: int, rng: random.Random) -> str:
+    """Joltage adapters with gaps of one to three jolts"""
+    jolts, jolt = [], 0
+    for _ in range(size):
+        jolt += rng.choices((1, 2, 3), weights=(6, 1, 3))[0]
+        jolts.append(jolt)
+    rng.shuffle(jolts)
+    return "\n".join(map(str, jolts))
+
+
+def occupied_adjacent(occupied: np.ndarray) -> np.ndarray:
+    """Number of occupied seats adjacent to every position"""
+    padded = np.pad(occupied, 1).astype(np.uint8)
+    n_rows, n_cols = occupied.shape
+    return sum(
+        padded[1 + d_row:1 + d_row + n_rows, 1 + d_col:1 + d_col + n_cols]
+        for d_row in (-1, 0, 1)
+        for d_col in (-1, 0, 1)
+        if d_row or d_col
+    )
+
+
+def settle_seats(seats: np.ndarray) -> np.ndarray:
+    """
+    Turn seats into floor until the 2020/11 part 1 rules reach a stable state from empty seats
+
+    The rules only ever end in a stable state or alternate between two states. The seats that
+    alternate become floor and the simulation starts over, until it settles.
+    """
+    occupied, previous = np.zeros_like(seats), None
+    while True:
+        adjacent = occupied_adjacent(occupied)
+        new_occupied = seats & np.where(occupied, adjacent < 4, adjacent == 0)
+        if np.array_equal(new_occupied, occupied):
+            return seats
+        if previous is not None and np.array_equal(new_occupied, previous):
+            seats = seats & ~(new_occupied ^ occupied)
+            occupied, previous = np.zeros_like(seats), None
+            continue
+        previous, occupied = occupied, new_occupied
+
+
+@register(2020, 11)
+def seat_layout(size: int, rng: random.Random) -> str:
+    """
+    Square seat layout of size by size positions that settles under the part 1 rules
+
+    Random layouts of more than about 100 by 100 positions nearly always contain seats that keep
+    alternating, these are turned into floor.
+    """
+    seats = np.array([rng.choices((True, False), weights=(4, 1), k=size) for _ in range(size)])
+    return "\n".join("".join("L" if seat else "." for seat in row) for row in settle_seats(seats))
+
+
+@register(2020, 12)
+def navigation_instructions(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        action = rng.choices("NESWLRF", weights=(1, 1, 1, 1, 1, 1, 3))[0]
+        value = rng.choice((90, 180, 270)) if action in "LR" else rng.randint(1, 100)
+        lines.append(f"{action}{value}")
+    return "\n".join(lines)
@@ -0,0 +1,53 @@
+"""
+Input generators for the 2021 puzzles
+"""
+import random
+
+from aoctools.generators import register
+
+
+@register(2021, 1)
+def sonar_depths(size: int, rng: random.Random) -> str:
+    """Random walk of depths that stays positive"""
+    depths, depth = [], rng.randint(100, 200)
+    for _ in range(size):
+        depth = max(depth + rng.randint(-10, 20), 1)
+        depths.append(depth)
+    return "\n".join(map(str, depths))
+
+
+@register(2021, 2)
+def submarine_course(size: int, rng: random.Random) -> str:
+    directions = rng.choices(("forward", "down", "up"), weights=(2, 2, 1), k=size)
+    return "\n".join(f"{direction} {rng.randint(1, 9)}" for direction in directions)
+
+
+@register(2021, 3)
+def diagnostic_report(size: int, rng: random.Random) -> str:
+    """
+    Unique binary numbers of at least 12 bits, wide enough to hold size unique numbers
+
+    Every bit is biased towards 0 or 1, and reports where a column has no clear most common bit
+    are drawn again, as the puzzle guarantees one. Two unique numbers always tie in some column,
+    so reports have at least 3 numbers.
+    """
+    size = max(size, 3)
+    n_bits = max(12, (2 * size).bit_length())
+    while True:
+        one_probabilities = [rng.choice((0.35, 0.65)) for _ in range(n_bits)]
+        numbers = set()
+        while len(numbers) < size:
+            numbers.add(sum(
+                (rng.random() < p) << (n_bits - bit - 1) for bit, p in enumerate(one_probabilities)
+            ))
+        ones = [sum(number >> bit & 1 for number in numbers) for bit in range(n_bits)]
+        if all(2 * count != size and count != size // 2 for count in ones):
+            break
+    return "\n".join(f"{number:0{n_bits}b}" for number in rng.sample(sorted(numbers), size))
+
+
+@register(2021, 15)
+def risk_levels(size: int, rng: random.Random) -> str:
+    """Square grid of size by size risk levels, at least 2 by 2"""
+    size = max(size, 2)
+    return "\n".join("".join(rng.choices("123456789", k=size)) for _ in range(size))
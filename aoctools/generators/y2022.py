@@ -0,0 +1,15 @@
+"""
+Input generators for the 2022 puzzles
+"""
+import random
+
+from aoctools.generators import register
+
+
+@register(2022, 20)
+def encrypted_coordinates(size: int, rng: random.Random) -> str:
+    """Mixing sequence of at least 2 numbers with exactly one zero"""
+    size = max(size, 2)
+    numbers = [rng.choice((-1, 1)) * rng.randint(1, 10_000) for _ in range(size - 1)]
+    numbers.insert(rng.randrange(size), 0)
+    return "\n".join(map(str, numbers))
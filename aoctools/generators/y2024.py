@@ -0,0 +1,27 @@
+"""
+Input generators for the 2024 puzzles
+"""
+import random
+
+from aoctools.generators import register
+
+
+@register(2024, 1)
+def location_lists(size: int, rng: random.Random) -> str:
+    """Two columns of location ids, the right one reuses left ids for a similarity score"""
+    left = [rng.randint(10_000, 99_999) for _ in range(size)]
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randint(10_000, 99_999)
+             for _ in range(size)]
+    return "\n".join(f"{l}   {r}" for l, r in zip(left, right))
+
+
+@register(2024, 9)
+def disk_map(size: int, rng: random.Random) -> str:
+    """Disk map of size digits (rounded up to odd, at least 3) that starts and ends with a file"""
+    n_files = max(size // 2 + 1, 2)
+    digits = []
+    for _ in range(n_files - 1):
+        digits.append(rng.randint(1, 9))
+        digits.append(rng.randint(0, 9))
+    digits.append(rng.randint(1, 9))
+    return "".join(map(str, digits))
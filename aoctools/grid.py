@@ -0,0 +1,68 @@
+"""
+Parse character grids into 2-D numpy arrays without per-character Python work, and read files
+in blocks of whole records to stream them
+"""
+from typing import BinaryIO, Iterator, Mapping
+
+import numpy as np
+
+NEWLINE = ord("\n")
+
+
+def lookup_table(
+    mapping: Mapping[str, int | bool], default: int | bool = 0, dtype=int
+) -> np.ndarray:
+    """Translation table from character code to value, for use with ``read_grid``"""
+    table = np.full(256, default, dtype=dtype)
+    for char, value in mapping.items():
+        table[ord(char)] = value
+    return table
+
+
+DIGITS = lookup_table({str(digit): digit for digit in range(10)})
+
+
+def read_grid(input_data: str | bytes | memoryview, table: np.ndarray | None = None) -> np.ndarray:
+    """
+    Read a rectangular grid with one row per line
+
+    Without a table the result is a read-only uint8 view of the character codes of the input
+    buffer, with the newlines strided over. With a table every character code is looked up in it,
+    which gives a new array of the table dtype.
+    """
+    buffer = input_data.encode() if isinstance(input_data, str) else input_data
+    flat = np.frombuffer(buffer, dtype=np.uint8)
+    if flat.size and flat[-1] == NEWLINE:
+        flat = flat[:-1]
+    (newlines,) = np.nonzero(flat == NEWLINE)
+    width = newlines[0].item() if newlines.size else flat.size
+    n_rows = (flat.size + 1) // (width + 1)
+    if n_rows * (width + 1) - 1 != flat.size or np.any(newlines % (width + 1) != width):
+        raise ValueError("grid rows are not all of the same length")
+    grid = np.lib.stride_tricks.as_strided(
+        flat, shape=(n_rows, width), strides=(width + 1, 1), writeable=False
+    )
+    return grid if table is None else table[grid]
+
+
+def iter_blocks(
+    file: BinaryIO, separator: bytes = b"\n", block_size: int = 2**20
+) -> Iterator[bytes]:
+    """
+    Yield blocks of whole separator-separated records from a binary file, read block_size at a time
+
+    A block leaves out the separator after its last record, blocks of only whitespace are skipped.
+    Only the current block and the incomplete record after it are held in memory.
+    """
+    pending = b""
+    while data := file.read(block_size):
+        data = pending + data
+        end = data.rfind(separator)
+        if end < 0:
+            pending = data
+            continue
+        if data[:end].strip():
+            yield data[:end]
+        pending = data[end + len(separator):]
+    if pending.strip():
+        yield pending
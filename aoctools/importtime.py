@@ -0,0 +1,114 @@
+"""
+Measure the startup time of each solution with ``python -X importtime`` in a fresh interpreter
+"""
+import ast
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from aoctools import REPO_ROOT
+from aoctools.discovery import Solution
+
+MARKER = "aoctools-importtime-start"
+
+
+@dataclass
+class ImportTime:
+    """Self and cumulative import time of a module in microseconds"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    level: int
+
+
+@dataclass
+class StartupReport:
+    """Import times of everything a solution imports on startup"""
+    solution: Solution
+    imports: list[ImportTime] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def total_us(self) -> int:
+        return sum(imported.cumulative_us for imported in self.imports if imported.level == 0)
+
+    def heaviest(self, n: int = 3) -> list[ImportTime]:
+        top_level = [imported for imported in self.imports if imported.level == 0]
+        return sorted(top_level, key=lambda imported: imported.cumulative_us, reverse=True)[:n]
+
+
+def startup_code(solution: Solution) -> str:
+    """
+    Code that imports the solution like the runner does
+
+    Script-style solutions do all their work on import, so only their top level import statements
+    are executed.
+    """
+    marker = f"sys.stderr.write('{MARKER}\\n')\n"
+    if not solution.is_script:
+        return (
+            "import sys\n"
+            "from aoctools.discovery import discover_solutions, load_module\n"
+            f"(solution,) = discover_solutions(years=[{solution.year}], days=[{solution.day}])\n"
+            + marker
+            + "load_module(solution)\n"
+        )
+    tree = ast.parse(solution.path.read_text())
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "import sys\n" + marker + "\n".join(ast.unparse(node) for node in imports) + "\n"
+
+
+def parse_importtime(stderr: str) -> list[ImportTime]:
+    """Parse the ``-X importtime`` lines written after the marker"""
+    _, _, after_marker = stderr.partition(MARKER)
+    imports = []
+    for line in after_marker.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue  # header line
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append(ImportTime(name.strip(), int(self_us), int(cumulative_us), level))
+    return imports
+
+
+def measure_startup(solution: Solution) -> StartupReport:
+    """Import the solution in a new interpreter and collect its import times"""
+    report = StartupReport(solution)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", startup_code(solution)],
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        report.error = process.stderr.strip().splitlines()[-1]
+    report.imports = parse_importtime(process.stderr)
+    return report
+
+
+def measure_all(
+    solutions: Iterable[Solution], max_workers: int | None = None
+) -> list[StartupReport]:
+    """Measure the startup of all solutions, each in its own interpreter"""
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(measure_startup, solutions))
+
+
+def format_startup(reports: list[StartupReport], top: int = 3) -> str:
+    """Format the startup times as a table with the heaviest top level imports per solution"""
+    lines = [f"{'puzzle':<13} {'startup [ms]':>12}  heaviest imports [ms]"]
+    for report in sorted(reports, key=lambda r: r.total_us, reverse=True):
+        heaviest = ", ".join(
+            f"{imported.module} {imported.cumulative_us / 1000:.1f}"
+            for imported in report.heaviest(top)
+        )
+        if report.error is not None:
+            heaviest = f"ERROR {report.error}"
+        lines.append(f"{str(report.solution):<13} {report.total_us / 1000:>12.1f}  {heaviest}")
+    return "\n".join(lines)
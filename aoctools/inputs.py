@@ -0,0 +1,197 @@
+"""
+Offline, content-addressed store for puzzle inputs and examples
+
+Inputs are stored as ``solutions/YYYY/dayN/<variant>.txt`` and only read when first used. Files are
+memory-mapped and shared by content hash, so a batch run maps every distinct input exactly once.
+The Puzzle class is a stand-in for ``aocd.models.Puzzle`` that never touches the network, aocd is
+only imported to fetch missing puzzles into the store.
+"""
+import hashlib
+import json
+import mmap
+import warnings
+from functools import cached_property
+from pathlib import Path
+from typing import NamedTuple
+
+from aoctools import SOLUTIONS_DIR
+
+INPUT = "input"
+EXAMPLE = "example"
+ANSWERS_FILE = "answers.json"
+
+
+class Example(NamedTuple):
+    """Example input with its answers, mirrors ``aocd.examples.Example``"""
+    input_data: str
+    answer_a: str | None = None
+    answer_b: str | None = None
+    extra: str | None = None
+
+
+class PuzzleInput:
+    """Lazily memory-mapped puzzle input file"""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def __repr__(self):
+        return f"PuzzleInput({self.path})"
+
+    @cached_property
+    def buffer(self) -> memoryview:
+        """Read-only view on the mapped file without copying it"""
+        with open(self.path, "rb") as f:
+            if f.seek(0, 2) == 0:
+                return memoryview(b"")  # empty files can not be mapped
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @cached_property
+    def digest(self) -> str:
+        """sha256 of the file content"""
+        return hashlib.sha256(self.buffer).hexdigest()
+
+    @cached_property
+    def text(self) -> str:
+        """Decoded input without trailing newlines, like ``aocd.models.Puzzle.input_data``"""
+        return str(self.buffer, "utf-8").rstrip("\n")
+
+
+class InputStore:
+    """Puzzle inputs keyed by (year, day, variant) and deduplicated by content hash"""
+
+    def __init__(self, root: Path = SOLUTIONS_DIR):
+        self.root = Path(root)
+        self._by_key: dict[tuple[int, int, str], PuzzleInput] = {}
+        self._by_digest: dict[str, PuzzleInput] = {}
+
+    def day_dir(self, year: int, day: int) -> Path:
+        return self.root / str(year) / f"day{day}"
+
+    def path(self, year: int, day: int, variant: str = INPUT) -> Path:
+        return self.day_dir(year, day) / f"{variant}.txt"
+
+    def __contains__(self, key: tuple[int, int, str]) -> bool:
+        return key in self._by_key or self.path(*key).exists()
+
+    def get(self, year: int, day: int, variant: str = INPUT) -> PuzzleInput:
+        """Return the (shared) input for the key, raises FileNotFoundError when not stored"""
+        key = (year, day, variant)
+        if key not in self._by_key:
+            path = self.path(*key)
+            if not path.exists():
+                raise FileNotFoundError(
+                    f"no {variant} stored for {year}/day{day} at {path}, "
+                    f"fetch it with: python -m aoctools fetch -y {year} -d {day}"
+                )
+            puzzle_input = PuzzleInput(path)
+            self._by_key[key] = self._by_digest.setdefault(puzzle_input.digest, puzzle_input)
+        return self._by_key[key]
+
+    def variants(self, year: int, day: int, prefix: str = "") -> list[str]:
+        """Stored variants of a day, optionally only those starting with prefix"""
+        return sorted(
+            path.stem for path in self.day_dir(year, day).glob(f"{prefix}*.txt")
+        )
+
+    def answers(self, year: int, day: int) -> dict[str, dict[str, str | None]]:
+        """Known answers per variant as ``{variant: {"a": ..., "b": ...}}``"""
+        answers_path = self.day_dir(year, day) / ANSWERS_FILE
+        if not answers_path.exists():
+            return {}
+        return json.loads(answers_path.read_text())
+
+    def write(self, year: int, day: int, variant: str, data: str) -> Path:
+        """Add an input to the store"""
+        path = self.path(year, day, variant)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(data if data.endswith("\n") else data + "\n")
+        self._by_key.pop((year, day, variant), None)
+        return path
+
+    def write_answers(self, year: int, day: int, answers: dict[str, dict[str, str | None]]):
+        """Merge answers per variant into the stored answers"""
+        stored = self.answers(year, day)
+        for variant, variant_answers in answers.items():
+            stored.setdefault(variant, {}).update(variant_answers)
+        answers_path = self.day_dir(year, day) / ANSWERS_FILE
+        answers_path.parent.mkdir(parents=True, exist_ok=True)
+        answers_path.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+
+
+default_store = InputStore()
+
+
+def fetch_into_store(year: int, day: int, store: InputStore = default_store):
+    """Fetch input and examples of a puzzle with aocd and write them to the store"""
+    from aocd.models import Puzzle as AocdPuzzle  # network and aocd config are only needed here
+
+    puzzle = AocdPuzzle(year=year, day=day)
+    store.write(year, day, INPUT, puzzle.input_data)
+    example_answers = {}
+    for i, example in enumerate(puzzle.examples, start=1):
+        variant = EXAMPLE if i == 1 else f"{EXAMPLE}-{i}"
+        store.write(year, day, variant, example.input_data)
+        example_answers[variant] = {"a": example.answer_a, "b": example.answer_b}
+    store.write_answers(year, day, example_answers)
+
+
+class Puzzle:
+    """
+    Offline stand-in for ``aocd.models.Puzzle``
+
+    Inputs and examples come from the InputStore. Assigning an answer never submits it, it is only
+    compared to the known answer of the input in ``answers.json`` with a warning when it differs.
+    Until an answer is assigned, the known answer is returned.
+    """
+
+    def __init__(self, day: int, year: int, store: InputStore = default_store):
+        self.day = day
+        self.year = year
+        self.store = store
+        self._answers: dict[str, object] = {}
+
+    def __repr__(self):
+        return f"Puzzle(day={self.day}, year={self.year})"
+
+    @property
+    def input_data(self) -> str:
+        return self.store.get(self.year, self.day, INPUT).text
+
+    def known_answer(self, part: str) -> str | None:
+        """Known answer of part "a" or "b" for the input"""
+        return self.store.answers(self.year, self.day).get(INPUT, {}).get(part)
+
+    def _set_answer(self, part: str, value):
+        known = self.known_answer(part)
+        if value is not None and known is not None and str(value) != known:
+            warnings.warn(f"answer {part} of {self} is {value!r}, the known answer is {known!r}")
+        self._answers[part] = value
+
+    @property
+    def answer_a(self):
+        return self._answers.get("a", self.known_answer("a"))
+
+    @answer_a.setter
+    def answer_a(self, value):
+        self._set_answer("a", value)
+
+    @property
+    def answer_b(self):
+        return self._answers.get("b", self.known_answer("b"))
+
+    @answer_b.setter
+    def answer_b(self, value):
+        self._set_answer("b", value)
+
+    @property
+    def examples(self) -> list[Example]:
+        answers = self.store.answers(self.year, self.day)
+        return [
+            Example(
+                self.store.get(self.year, self.day, variant).text,
+                answers.get(variant, {}).get("a"),
+                answers.get(variant, {}).get("b"),
+            )
+            for variant in self.store.variants(self.year, self.day, prefix=EXAMPLE)
+        ]
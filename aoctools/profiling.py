@@ -0,0 +1,105 @@
+"""
+Profile a solution part with cProfile and tracemalloc and record its peak resident memory
+"""
+import cProfile
+import io
+import pstats
+import resource
+import contextlib
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from aoctools import REPO_ROOT
+
+DEFAULT_PROFILE_DIR = REPO_ROOT / "profiles"
+
+# allocations of the profiling and timing harness are not those of the solution
+HARNESS_FILTERS = [
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, str(Path(__file__).with_name("runner.py"))),
+    tracemalloc.Filter(False, contextlib.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the current process in MB"""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10  # bytes vs kB
+
+
+class PeakSnapshotSampler:
+    """
+    Snapshot the traced allocations in a background thread while a part runs
+
+    A snapshot is only taken when more memory is traced than at the previous one, so the kept
+    snapshot shows the allocations closest to the peak instead of what is still alive at the end.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.traced = -1
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def sample(self):
+        traced, _ = tracemalloc.get_traced_memory()
+        if traced > self.traced:
+            self.snapshot, self.traced = tracemalloc.take_snapshot(), traced
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def __enter__(self) -> "PeakSnapshotSampler":
+        self.sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+
+@contextmanager
+def profiled(report_path: Path, n_stats: int = 30, n_allocations: int = 20):
+    """
+    Profile the body of the with statement
+
+    Writes ``<report_path>.prof`` with the cProfile stats, for e.g. snakeviz, and
+    ``<report_path>.txt`` with the heaviest calls, the top allocations near the traced peak and
+    the peak RSS.
+    """
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    profiler = cProfile.Profile()
+    sampler = PeakSnapshotSampler()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        with sampler:
+            yield
+    finally:
+        profiler.disable()
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        snapshot = sampler.snapshot.filter_traces(HARNESS_FILTERS)
+
+        profiler.dump_stats(report_path.with_suffix(".prof"))
+        stats_stream = io.StringIO()
+        pstats.Stats(profiler, stream=stats_stream).sort_stats("cumulative").print_stats(n_stats)
+        allocations = "\n".join(
+            str(statistic) for statistic in snapshot.statistics("lineno")[:n_allocations]
+        )
+        report_path.with_suffix(".txt").write_text(
+            f"peak RSS: {peak_rss_mb():.1f} MB\n"
+            f"peak traced memory: {traced_peak / 2**20:.1f} MB\n\n"
+            f"top {n_allocations} allocations at {sampler.traced / 2**20:.1f} MB traced\n"
+            f"{allocations}\n\n"
+            f"cProfile\n{stats_stream.getvalue()}"
+        )
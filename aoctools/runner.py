@@ -0,0 +1,227 @@
+"""
+Run the part functions of all discovered solutions in parallel over a process pool
+"""
+import contextlib
+import io
+import os
+import runpy
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from aoctools import REPO_ROOT
+from aoctools.cache import AnswerCache, CacheKey, CachedAnswer, source_digest
+from aoctools.discovery import SCRIPT_PART, Solution, load_module
+from aoctools.inputs import INPUT, default_store
+from aoctools.profiling import profiled
+
+PART_ANSWER_KEYS = {"part_1": ("a",), "part_2": ("b",), "part_1_and_2": ("a", "b")}
+
+
+@dataclass
+class PartResult:
+    """Answer and timings of a single part function call"""
+    solution: Solution
+    part: str
+    answer: Any = None
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    error: str | None = None
+    cached: bool = False
+    expected: tuple[str, ...] | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def answers(self) -> tuple[str, ...]:
+        """Answer as strings like aocd stores them, one per puzzle part"""
+        answers = self.answer if self.part == "part_1_and_2" else (self.answer,)
+        return tuple(str(answer) for answer in answers)
+
+    @property
+    def correct(self) -> bool | None:
+        """Whether the answer matches the known answer, None when no answer is known"""
+        if self.expected is None:
+            return None
+        return self.ok and self.answers == self.expected
+
+
+def load_input(year: int, day: int) -> str:
+    """Read the puzzle input from the offline input store"""
+    return default_store.get(year, day).text
+
+
+def run_script(solution: Solution) -> str:
+    """Run the ``__main__`` block of a script-style solution and return what it printed"""
+    with contextlib.redirect_stdout(io.StringIO()) as stdout:
+        runpy.run_path(str(solution.path), run_name="__main__")
+    return " | ".join(line for line in stdout.getvalue().splitlines() if line.strip())
+
+
+def bind_part(solution: Solution, part: str, input_data: str | None = None) -> Callable[[], Any]:
+    """
+    Return the part as a function without arguments, so that reading the input is not timed
+
+    The stored puzzle input is used unless another input_data is given.
+    """
+    if part == SCRIPT_PART:
+        if input_data is not None:
+            raise ValueError(f"script-style solution {solution} can not be given an input")
+        return partial(run_script, solution)
+    part_function = getattr(load_module(solution), part)
+    if input_data is None:
+        input_data = load_input(solution.year, solution.day)
+    return partial(part_function, input_data)
+
+
+def run_part(solution: Solution, part: str, profile_dir: Path | None = None) -> PartResult:
+    """
+    Run a single part and time it, an exception is captured in the result
+
+    With a profile_dir the part is profiled and the report is written to
+    ``<profile_dir>/YYYY/dayN/<part>.{prof,txt}``.
+    """
+    result = PartResult(solution, part)
+    try:
+        run = bind_part(solution, part)
+        profile = (
+            profiled(profile_dir / str(solution.year) / f"day{solution.day}" / part)
+            if profile_dir is not None
+            else contextlib.nullcontext()
+        )
+        with profile:
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            result.answer = run()
+            result.cpu_time = time.process_time() - cpu_start
+            result.wall_time = time.perf_counter() - wall_start
+    except Exception:
+        result.error = traceback.format_exc(limit=-1).strip().splitlines()[-1]
+    return result
+
+
+def init_worker():
+    """Solutions expect to be run from the repository root"""
+    os.chdir(REPO_ROOT)
+
+
+def cache_key(solution: Solution, part: str) -> CacheKey | None:
+    """Key of a part in the answer cache, None when the input is not stored"""
+    try:
+        input_digest = default_store.get(solution.year, solution.day).digest
+    except FileNotFoundError:
+        return None
+    return CacheKey(input_digest, source_digest(solution), part)
+
+
+def run_all(
+    solutions: Iterable[Solution],
+    max_workers: int | None = None,
+    cache: AnswerCache | None = None,
+    profile_dir: Path | None = None,
+) -> list[PartResult]:
+    """
+    Run every part of every solution on a process pool sized to the number of cores
+
+    With a cache, parts for which neither the input nor the solver source changed are not run
+    again and their cached answer is returned instead. When profiling, the cache is bypassed and
+    every part runs in a fresh worker process so that its peak RSS is its own.
+    """
+    if profile_dir is not None:
+        cache = None
+    results, tasks = [], []
+    for solution in solutions:
+        for part in solution.run_parts:
+            key = cache_key(solution, part) if cache is not None else None
+            if key is not None and (cached := cache.get(key)) is not None:
+                results.append(PartResult(solution, part, *cached, cached=True))
+            else:
+                tasks.append((solution, part, key))
+
+    max_workers = max_workers or os.cpu_count()
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=init_worker,
+        max_tasks_per_child=None if profile_dir is None else 1,
+    ) as executor:
+        futures = {
+            executor.submit(run_part, solution, part, profile_dir): key
+            for solution, part, key in tasks
+        }
+        for future in as_completed(futures):
+            result, key = future.result(), futures[future]
+            results.append(result)
+            if key is not None and result.ok:
+                cache.put(key, CachedAnswer(result.answer, result.wall_time, result.cpu_time))
+    if cache is not None:
+        cache.save()
+    return sorted(results, key=lambda r: (r.solution, r.part))
+
+
+def known_answers(solution: Solution, part: str) -> tuple[str, ...] | None:
+    """Known answers of a part for the stored input, None when any of them is unknown"""
+    if part not in PART_ANSWER_KEYS:
+        return None  # script-style solutions only print their answers
+    known = default_store.answers(solution.year, solution.day).get(INPUT, {})
+    answers = tuple(known.get(key) for key in PART_ANSWER_KEYS[part])
+    return None if None in answers else answers
+
+
+def verify(results: list[PartResult]) -> list[PartResult]:
+    """Set the known answers on the results, nothing is ever submitted"""
+    for result in results:
+        result.expected = known_answers(result.solution, result.part)
+    return results
+
+
+def record_answers(results: list[PartResult]) -> int:
+    """
+    Store the answers of parts without a known answer as known answers, returns the count
+
+    Answers that are None, like those of unfinished parts, are never recorded.
+    """
+    recorded = 0
+    for result in results:
+        if not result.ok or result.part not in PART_ANSWER_KEYS:
+            continue
+        known = default_store.answers(result.solution.year, result.solution.day).get(INPUT, {})
+        raw_answers = result.answer if result.part == "part_1_and_2" else (result.answer,)
+        new_answers = {
+            key: answer
+            for key, raw_answer, answer in zip(
+                PART_ANSWER_KEYS[result.part], raw_answers, result.answers
+            )
+            if raw_answer is not None and known.get(key) is None
+        }
+        if new_answers:
+            default_store.write_answers(
+                result.solution.year, result.solution.day, {INPUT: new_answers}
+            )
+            recorded += len(new_answers)
+    return recorded
+
+
+def format_results(results: list[PartResult], verified: bool = False) -> str:
+    """Format the results as a table with one line per part"""
+    lines = [f"{'puzzle':<13} {'part':<13} {'wall [s]':>9} {'cpu [s]':>9}  answer"]
+    if verified:
+        lines[0] = lines[0].replace("  answer", f"  {'check':<7} answer")
+    for result in results:
+        answer = result.answer if result.ok else f"ERROR {result.error}"
+        if result.cached:
+            answer = f"{answer} (cached)"
+        if result.correct is False and result.ok:
+            answer = f"{answer} (expected {' | '.join(result.expected)})"
+        if verified:
+            check = {True: "ok", False: "WRONG", None: "unknown"}[result.correct]
+            answer = f"{check:<7} {answer}"
+        lines.append(
+            f"{str(result.solution):<13} {result.part:<13} "
+            f"{result.wall_time:>9.3f} {result.cpu_time:>9.3f}  {answer}"
+        )
+    return "\n".join(lines)
@@ -48,17 +48,78 @@ Multiplying them together produces the answer, 241861950.
 In your expense report, what is the product of the three entries that sum to 2020?
 
 """
-import numpy as np
-
-with open("solutions/2020/day1/input.txt", "r") as f:
-    numbers = [*map(int, f.read().split())]
-
-num = np.array(numbers)
-sum2d = num[None, :] + num[:, None]
-sum3d = num[None, None, :] + num[None, :, None] + num[:, None, None]
-
-a11, a12, = next(zip(*np.where(sum2d == 2020)))
-a21, a22, a23 = next(zip(*np.where(sum3d == 2020)))
-
-print(f"Answer 2: {num[a11] * num[a12]}")
-print(f"Answer 2: {num[a21] * num[a22] * num[a23]}")
+from bisect import bisect_left
+from math import prod
+from typing import Iterable, Iterator, Sequence
+
+from aoctools.inputs import Puzzle
+
+
+def _k_sums(sorted_numbers: Sequence[int], start: int, k: int, target: int) -> Iterator[tuple[int, ...]]:
+    """Yield the distinct combinations of k numbers from sorted_numbers[start:] summing to target"""
+    if k == 1:
+        i = bisect_left(sorted_numbers, target, lo=start)
+        if i < len(sorted_numbers) and sorted_numbers[i] == target:
+            yield (target,)
+        return
+    if k == 2:  # two pointers closing in from both ends
+        low, high = start, len(sorted_numbers) - 1
+        while low < high:
+            pair_sum = sorted_numbers[low] + sorted_numbers[high]
+            if pair_sum < target:
+                low += 1
+            elif pair_sum > target:
+                high -= 1
+            else:
+                yield sorted_numbers[low], sorted_numbers[high]
+                while low < high and sorted_numbers[low] == sorted_numbers[low + 1]:
+                    low += 1
+                low += 1
+        return
+    largest_rest = sum(sorted_numbers[len(sorted_numbers) - k + 1:])
+    for i in range(start, len(sorted_numbers) - k + 1):
+        if i > start and sorted_numbers[i] == sorted_numbers[i - 1]:
+            continue  # same first number gives the same combinations
+        if sum(sorted_numbers[i:i + k]) > target:
+            break  # the smallest remaining combination is already too large
+        if sorted_numbers[i] + largest_rest < target:
+            continue
+        for rest in _k_sums(sorted_numbers, i + 1, k - 1, target - sorted_numbers[i]):
+            yield sorted_numbers[i], *rest
+
+
+def find_k_sum(
+    numbers: Iterable[int], k: int, target: int, find_all: bool = False
+) -> tuple[int, ...] | list[tuple[int, ...]] | None:
+    """
+    Find k entries of numbers that sum to target
+
+    The numbers are sorted once, after which the last two entries of a combination are found with
+    two pointers. This takes O(n^(k-1)) time and O(n) memory. Returns the first combination (None
+    if there is none), or with find_all every distinct combination, in ascending order.
+    """
+    combinations = _k_sums(sorted(numbers), 0, k, target)
+    if find_all:
+        return list(combinations)
+    return next(combinations, None)
+
+
+def part_1(input_data) -> int:
+    return prod(find_k_sum(map(int, input_data.split()), k=2, target=2020))
+
+
+def part_2(input_data) -> int:
+    return prod(find_k_sum(map(int, input_data.split()), k=3, target=2020))
+
+
+def main():
+    puzzle = Puzzle(day=1, year=2020)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
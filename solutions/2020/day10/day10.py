@@ -180,28 +180,64 @@ What is the total number of distinct ways you can arrange the adapters to connec
 outlet to your device?
 
 """
-from math import prod
+from collections import deque
 
-with open("solutions/2020/day10/input.txt", "r") as f:
-    jolts = [0, *map(int, f.read().split())]
+from aoctools.inputs import Puzzle
 
+MAX_JOLT_GAP = 3
 
-builtin_jolt_adapter = max(jolts) + 3
-sorted_jolts = sorted(jolts)
-sorted_jolts.append(builtin_jolt_adapter)
 
-jolt_diffs = [j2 - j1 for j1, j2 in zip(sorted_jolts[:-1], sorted_jolts[1:])]
-sequences = []
-seq_len = 0
-for diff in jolt_diffs:
-    if diff == 1:
-        seq_len += 1
-    elif seq_len > 0:
-        sequences.append(seq_len)
-        seq_len = 0
+def sorted_jolts(input_data: str) -> list[int]:
+    """Sorted jolts of the outlet, the adapters and the builtin adapter"""
+    jolts = sorted(map(int, input_data.split()))
+    return [0, *jolts, jolts[-1] + 3]
 
-seq_pos = {4: 7, 3: 4, 2: 2, 1: 1}   # maps sequence length of 1s to number of possibilities
 
+def jolt_differences(input_data: str) -> list[int]:
+    """Differences between the sorted jolts of the outlet, the adapters and the builtin adapter"""
+    jolts = sorted_jolts(input_data)
+    return [j2 - j1 for j1, j2 in zip(jolts[:-1], jolts[1:])]
 
-print(f"Answer 1: {jolt_diffs.count(1) * jolt_diffs.count(3)}")
-print(f"Answer 2: {prod(value**sequences.count(key) for key, value in seq_pos.items())}")
+
+def count_arrangements(
+    jolts: list[int], max_gap: int = MAX_JOLT_GAP, modulo: int | None = None
+) -> int:
+    """
+    Number of chains from the first to the last of the sorted, distinct jolts in a single pass
+
+    The number of ways to reach a jolt is the sum of the ways to reach the jolts at most max_gap
+    lower, which are kept in a sliding window with their running sum. Counts are exact big
+    integers, or reduced modulo ``modulo`` when given.
+    """
+    window = deque([(jolts[0], 1)])
+    window_ways = 1
+    ways = 1
+    for jolt in jolts[1:]:
+        while window and jolt - window[0][0] > max_gap:
+            window_ways -= window.popleft()[1]
+        ways = window_ways if modulo is None else window_ways % modulo
+        window.append((jolt, ways))
+        window_ways += ways
+    return ways
+
+
+def part_1(input_data) -> int:
+    jolt_diffs = jolt_differences(input_data)
+    return jolt_diffs.count(1) * jolt_diffs.count(3)
+
+
+def part_2(input_data) -> int:
+    return count_arrangements(sorted_jolts(input_data))
+
+
+def main():
+    puzzle = Puzzle(day=10, year=2020)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -234,27 +234,84 @@ equilibrium is reached, how many seats end up occupied?
 
 """
 import numpy as np
-from scipy.ndimage import convolve
-
-
-with open("solutions/2020/day11/input.txt", "r") as f:
-    seating = f.read().translate(str.maketrans({"L": "0,", ".": "-1,"}))
-
-seated = np.array([np.fromstring(row, sep=',', dtype=int) for row in seating.split()])
-seat_mask = ~seated.astype(bool)
-seated[:] = 0   # treat floor as not seated
-adjacent_filter = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]])
-
-while True:
-    sitting_adjacent = convolve(seated, adjacent_filter, mode='constant', cval=0)
-    seating = (seated == 0) & (sitting_adjacent == 0) & seat_mask
-    leaving = (seated == 1) & (sitting_adjacent >= 4)
-    if np.sum(seating) == 0 and np.sum(leaving) == 0:
-        break
-    seated += seating.astype(int) - leaving.astype(int)
-
-print(f"Answer 1: {np.sum(seated)}")
-print(f"Answer 2: {''}")
-
-
 
+from aoctools.grid import lookup_table, read_grid
+from aoctools.inputs import Puzzle
+
+SEATS = lookup_table({"L": True, "#": True}, dtype=bool)
+DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def visible_neighbours(seat_mask: np.ndarray, line_of_sight: bool = False) -> np.ndarray:
+    """
+    Seat index of the neighbour in each of the 8 directions of every seat, computed once
+
+    Neighbours are the adjacent seats or, with line_of_sight, the first seat in each direction.
+    Directions without a seat point to index ``n_seats``, an extra seat that is never occupied.
+    """
+    n_rows, n_cols = seat_mask.shape
+    seat_rows, seat_cols = np.nonzero(seat_mask)
+    n_seats = seat_rows.size
+    seat_index = np.full(seat_mask.shape, n_seats)
+    seat_index[seat_rows, seat_cols] = np.arange(n_seats)
+
+    neighbours = np.full((n_seats, len(DIRECTIONS)), n_seats)
+    for direction, (d_row, d_col) in enumerate(DIRECTIONS):
+        unresolved = np.arange(n_seats)
+        rows, cols = seat_rows, seat_cols
+        while unresolved.size:
+            rows, cols = rows + d_row, cols + d_col
+            inside = (rows >= 0) & (rows < n_rows) & (cols >= 0) & (cols < n_cols)
+            unresolved, rows, cols = unresolved[inside], rows[inside], cols[inside]
+            found = seat_mask[rows, cols]
+            neighbours[unresolved[found], direction] = seat_index[rows[found], cols[found]]
+            if not line_of_sight:
+                break
+            unresolved, rows, cols = unresolved[~found], rows[~found], cols[~found]
+    return neighbours
+
+
+def simulate_seating(neighbours: np.ndarray, tolerance: int) -> int:
+    """
+    Apply the seating rules until the state is stable and return the number of occupied seats
+
+    An empty seat becomes occupied without occupied neighbours, an occupied seat becomes empty with
+    tolerance or more occupied neighbours. Every round is a gather and sum over the seats only.
+    Raises ValueError when the seating alternates between two states instead of stabilizing.
+    """
+    n_seats = neighbours.shape[0]
+    occupied = np.zeros(n_seats + 1, dtype=bool)  # the last seat stands in for no seat
+    previous = None
+    while True:
+        occupied_neighbours = occupied[neighbours].sum(axis=1)
+        new_occupied = np.where(
+            occupied[:n_seats], occupied_neighbours < tolerance, occupied_neighbours == 0
+        )
+        if np.array_equal(new_occupied, occupied[:n_seats]):
+            return int(new_occupied.sum())
+        if previous is not None and np.array_equal(new_occupied, previous):
+            raise ValueError("seating alternates between two states and never stabilizes")
+        previous = occupied[:n_seats].copy()
+        occupied[:n_seats] = new_occupied
+
+
+def part_1(input_data) -> int:
+    return simulate_seating(visible_neighbours(read_grid(input_data, SEATS)), tolerance=4)
+
+
+def part_2(input_data) -> int:
+    neighbours = visible_neighbours(read_grid(input_data, SEATS), line_of_sight=True)
+    return simulate_seating(neighbours, tolerance=5)
+
+
+def main():
+    puzzle = Puzzle(day=11, year=2020)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
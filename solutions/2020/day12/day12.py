@@ -99,50 +99,70 @@ Figure out where the navigation instructions actually lead. What is the Manhatta
 that location and the ship's starting position?
 
 """
-from enum import Enum
-from math import sin, cos, radians
+import numpy as np
 
+from aoctools.inputs import Puzzle
 
-class Cardinals(Enum):
-    """Cardinal degree directions"""
-    N = 0
-    E = 90
-    S = 180
-    W = 270
+ACTIONS = "NESWLRF"  # headings N, E, S, W are quarter turns clockwise from north
+NORTH, EAST, SOUTH, WEST, LEFT, RIGHT, FORWARD = range(len(ACTIONS))
+UNIT_VECTORS = np.array([(0, 1), (1, 0), (0, -1), (-1, 0)])  # (east, north) per heading
+ROTATIONS = np.array([  # (east, north) rotation matrices per number of quarter turns clockwise
+    [[1, 0], [0, 1]],
+    [[0, 1], [-1, 0]],
+    [[-1, 0], [0, -1]],
+    [[0, -1], [1, 0]],
+])
 
 
-class ShipPosition:
-    """Ship position tracker"""
+def compile_instructions(input_data: str) -> tuple[np.ndarray, np.ndarray]:
+    """Action codes and values of the navigation instructions"""
+    instructions = input_data.split()
+    actions = np.array([ACTIONS.index(instruction[0]) for instruction in instructions])
+    values = np.array([int(instruction[1:]) for instruction in instructions])
+    return actions, values
 
-    def __init__(self, lat: int, lon: int, direction: Cardinals):
-        self.lat = lat
-        self.lon = lon
-        self.direction = direction.value
 
-    def move(self, nav_char: str, nav_value: int):
-        """Move ship in cardinal direction, steer it's coarse or sail forward"""
-        if nav_char == "F":
-            self.move(Cardinals(self.direction).name, nav_value)
-        elif nav_char == "L":
-            self.direction = (self.direction - nav_value) % 360
-        elif nav_char == "R":
-            self.direction = (self.direction + nav_value) % 360
-        else:
-            self.lon += int(round(sin(radians(getattr(Cardinals, nav_char).value)))) * nav_value
-            self.lat += int(round(cos(radians(getattr(Cardinals, nav_char).value)))) * nav_value
+def navigate(
+    actions: np.ndarray, values: np.ndarray, waypoint: tuple[int, int] | None = None
+) -> np.ndarray:
+    """
+    Final (east, north) position of the ship that starts at the origin facing east
 
+    Without a waypoint N, E, S and W move the ship, with a waypoint they move the waypoint. All
+    instructions are replayed at once: the turns add up to the rotation after every instruction,
+    and in the frame that rotates along the waypoint moves are a plain cumulative sum.
+    """
+    turns = np.where(actions == RIGHT, values // 90, 0) - np.where(actions == LEFT, values // 90, 0)
+    rotations = ROTATIONS[np.cumsum(turns) % 4]
+    shifts = UNIT_VECTORS[actions % 4] * np.where(actions < LEFT, values, 0)[:, np.newaxis]
+    if waypoint is None:
+        waypoints = rotations[:, :, 0]  # the heading rotated from east
+        position = shifts.sum(axis=0)
+    else:
+        unrotated_shifts = np.einsum("nji,nj->ni", rotations, shifts)  # transposed is inverse
+        unrotated_waypoints = waypoint + np.cumsum(unrotated_shifts, axis=0)
+        waypoints = np.einsum("nij,nj->ni", rotations, unrotated_waypoints)
+        position = np.zeros(2, dtype=int)
+    forward = np.where(actions == FORWARD, values, 0)
+    return position + forward @ waypoints
 
-if __name__ == "__main__":
 
-    with open("solutions/2020/day12/input.txt", "r") as f:
-        instructions = [*f.read().splitlines()]
+def part_1(input_data) -> int:
+    return int(np.abs(navigate(*compile_instructions(input_data))).sum())
+
 
-    ship = ShipPosition(lat=0, lon=0, direction=Cardinals.E)
-    for instruction in instructions:
-        ship.move(instruction[0], int(instruction[1:]))
+def part_2(input_data) -> int:
+    return int(np.abs(navigate(*compile_instructions(input_data), waypoint=(10, 1))).sum())
 
-    print(f"Answer 1: {abs(ship.lat) + abs(ship.lon)}")
-    print(f"Answer 2: {''}")
 
+def main():
+    puzzle = Puzzle(day=12, year=2020)
 
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
 
+
+if __name__ == "__main__":
+    main()
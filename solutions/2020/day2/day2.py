@@ -53,20 +53,67 @@ How many passwords are valid according to the new interpretation of the policies
 
 
 """
-import re
+from dataclasses import dataclass
 
-with open("solutions/2020/day2/input.txt", "r") as f:
-    password_policies = f.read().splitlines()
+import numpy as np
 
+from aoctools.inputs import Puzzle
 
-pattern = re.compile(r"^(?P<min>\d{1,2})-(?P<max>\d{1,2}) (?P<character>[a-z]): (?P<password>\w*)$")
-valid_count_1 = 0
-valid_count_2 = 0
-for password_policy in password_policies:
-    match = pattern.match(password_policy)
-    valid_count_1 += int(match["min"]) <= match["password"].count(match["character"]) <= int(match["max"])
-    valid_count_2 += ((match["password"][int(match["min"]) - 1] == match["character"])
-                      ^ (match["password"][int(match["max"]) - 1] == match["character"])) == 1
 
-print(f"Answer 1: {valid_count_1}")
-print(f"Answer 2: {valid_count_2}")
+@dataclass
+class PasswordPolicies:
+    """Password policy columns, with the passwords as a zero-padded byte matrix"""
+    low: np.ndarray
+    high: np.ndarray
+    characters: np.ndarray
+    passwords: np.ndarray
+
+    @classmethod
+    def from_input(cls, input_data: str) -> "PasswordPolicies":
+        """Parse all ``low-high c: password`` lines at once into columns"""
+        fields = input_data.replace("-", " ").replace(":", " ").split()
+        if len(fields) % 4:
+            raise ValueError("policy lines should have a range, a character and a password")
+        low = np.fromstring(" ".join(fields[0::4]), dtype=int, sep=" ")
+        high = np.fromstring(" ".join(fields[1::4]), dtype=int, sep=" ")
+        passwords = np.array(fields[3::4], dtype=bytes)
+        width = max(passwords.itemsize, high.max())  # wide enough for every policy position
+        return cls(
+            low=low,
+            high=high,
+            characters=np.frombuffer("".join(fields[2::4]).encode(), dtype=np.uint8),
+            passwords=passwords.astype(f"S{width}").view(np.uint8).reshape(len(passwords), width),
+        )
+
+    def count_valid_by_occurrences(self) -> int:
+        """Passwords with the policy character between low and high times"""
+        occurrences = (self.passwords == self.characters[:, np.newaxis]).sum(axis=1)
+        return int(((self.low <= occurrences) & (occurrences <= self.high)).sum())
+
+    def count_valid_by_positions(self) -> int:
+        """Passwords with the policy character at exactly one of the low and high positions"""
+        rows = np.arange(len(self.passwords))
+        at_low = self.passwords[rows, self.low - 1] == self.characters
+        at_high = self.passwords[rows, self.high - 1] == self.characters
+        return int((at_low ^ at_high).sum())
+
+
+def part_1(input_data) -> int:
+    return PasswordPolicies.from_input(input_data).count_valid_by_occurrences()
+
+
+def part_2(input_data) -> int:
+    return PasswordPolicies.from_input(input_data).count_valid_by_positions()
+
+
+def main():
+    puzzle = Puzzle(day=2, year=2020)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
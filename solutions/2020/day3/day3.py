@@ -87,21 +87,68 @@ What do you get if you multiply together the number of trees encountered on each
 slopes?
 
 """
+import math
+from typing import Sequence
+
 import numpy as np
 
-with open("solutions/2020/day3/input.txt", "r") as f:
-    tree_patterns = f.read().splitlines()
+from aoctools.grid import lookup_table, read_grid
+from aoctools.inputs import Puzzle
+
+TREES = lookup_table({"#": True}, dtype=bool)
+SLOPES = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
+
+
+def count_trees(
+    trees: np.ndarray, slopes: Sequence[tuple[int, int]], fold: bool = False
+) -> list[int]:
+    """
+    Count the trees encountered on every slope of right steps per down steps
+
+    By default every slope gathers all of its positions from the map at once. With fold, the rows
+    are first summed per step modulo the period of the horizontal wrap-around, which many slopes
+    share, so each slope then only gathers a single period. Use this for many slopes on tall maps.
+    """
+    n_rows, width = trees.shape
+    if not fold:
+        counts = []
+        for right, down in slopes:
+            steps = np.arange(-(-n_rows // down))
+            counts.append(int(trees[steps * down, steps * right % width].sum()))
+        return counts
+
+    folded_trees = {}
+    counts = []
+    for right, down in slopes:
+        period = width // math.gcd(right, width)
+        if (down, period) not in folded_trees:
+            rows = trees[::down]
+            n_periods, remainder = divmod(len(rows), period)
+            folded = rows[:n_periods * period].reshape(n_periods, period, width).sum(axis=0)
+            folded[:remainder] += rows[n_periods * period:]
+            folded_trees[down, period] = folded
+        steps = np.arange(period)
+        counts.append(int(folded_trees[down, period][steps, steps * right % width].sum()))
+    return counts
+
+
+def part_1(input_data) -> int:
+    (trees,) = count_trees(read_grid(input_data, TREES), [(3, 1)])
+    return trees
+
+
+def part_2(input_data) -> int:
+    return math.prod(count_trees(read_grid(input_data, TREES), SLOPES))
+
+
+def main():
+    puzzle = Puzzle(day=3, year=2020)
 
-steps = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
-solutions = []
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
 
-for right, down in steps:
-    loc, trees = 0, 0
-    for pattern in tree_patterns[::down]:
-        if pattern[loc % len(pattern)] == "#":
-            trees += 1
-        loc += right
-    solutions.append(trees)
 
-print(f"Answer 1: {solutions[1]}")
-print(f"Answer 2: {np.product(solutions)}")
+if __name__ == "__main__":
+    main()
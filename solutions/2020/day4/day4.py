@@ -133,43 +133,65 @@ Continue to treat cid as optional. In your batch file, how many passports are va
 
 """
 
-field_validations = {
-    'byr': lambda byr: 1920 <= int(byr) <= 2002,
-    'iyr': lambda iyr: 2010 <= int(iyr) <= 2020,
-    'eyr': lambda eyr: 2020 <= int(eyr) <= 2030,
-    'hgt': lambda hgt: ((hgt.endswith('cm') and 150 <= int(hgt.strip('cm')) <= 193)
-                        or (hgt.endswith('in') and 59 <= int(hgt.strip('in')) <= 76)),
-    'hcl': lambda hcl: hcl.startswith("#") and int(hcl[1:], 16) and len(hcl) == 7,
-    'ecl': lambda ecl: ecl in {'amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth'},
-    'pid': lambda pid: len(pid) == 9 and int(pid)
+import io
+import re
+from typing import BinaryIO, Iterator
+
+from aoctools.grid import iter_blocks
+from aoctools.inputs import Puzzle
+
+FIELD_PATTERNS = {
+    "byr": re.compile(r"19[2-9]\d|200[0-2]"),
+    "iyr": re.compile(r"201\d|2020"),
+    "eyr": re.compile(r"202\d|2030"),
+    "hgt": re.compile(r"(1[5-8]\d|19[0-3])cm|(59|6\d|7[0-6])in"),
+    "hcl": re.compile(r"#[0-9a-f]{6}"),
+    "ecl": re.compile(r"amb|blu|brn|gry|grn|hzl|oth"),
+    "pid": re.compile(r"\d{9}"),
 }
+REQUIRED_FIELDS = tuple(f"{field}:" for field in FIELD_PATTERNS)
 
 
-def has_fields(passport: str):
-    """Check if passport contains all fields from field_validations"""
-    return all(field in passport for field in field_validations)
+def iter_passports(file: BinaryIO) -> Iterator[str]:
+    """Yield the blank line separated passports of a file, reading it in blocks"""
+    for block in iter_blocks(file, separator=b"\n\n"):
+        yield from block.decode().split("\n\n")
 
 
-def validate_passport(passport: str):
-    """Validate passport by field_validations"""
-    try:
-        for field in passport.split():
-            field_name, value = field.split(":")
-            if field_name in field_validations and not field_validations[field_name](value):
-                return False
-        return True
-    except ValueError:
-        return False
+def has_valid_fields(passport: str) -> bool:
+    """Check the value of every required field of the passport, other fields are ignored"""
+    for field in passport.split():
+        pattern = FIELD_PATTERNS.get(field[:3])
+        if pattern and not pattern.fullmatch(field, 4):
+            return False
+    return True
 
 
-if __name__ == "__main__":
-    with open("solutions/2020/day4/input.txt", "r") as f:
-        passport_data = f.read()
+def count_valid_passports(file: BinaryIO) -> tuple[int, int]:
+    """
+    Count the passports with all required fields and those whose required fields are also valid
+
+    Both counts are made in a single pass over the file, which holds only one block in memory.
+    """
+    complete = valid = 0
+    for passport in iter_passports(file):
+        if all(field in passport for field in REQUIRED_FIELDS):
+            complete += 1
+            valid += has_valid_fields(passport)
+    return complete, valid
+
+
+def part_1_and_2(input_data: str) -> tuple[int, int]:
+    return count_valid_passports(io.BytesIO(input_data.encode()))
 
-    passports = passport_data.split("\n\n")
-    n_field_passports = sum(has_fields(passport) for passport in passports)
-    n_valid_passports = sum(
-        has_fields(passport) and validate_passport(passport) for passport in passports)
 
-    print(f"Answer 1: {n_field_passports}")
-    print(f"Answer 2: {n_valid_passports}")
+def main():
+    puzzle = Puzzle(day=4, year=2020)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a, puzzle.answer_b = part_1_and_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
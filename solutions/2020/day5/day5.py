@@ -69,17 +69,64 @@ What is the ID of your seat?
 
 """
 
-with open("solutions/2020/day5/input.txt", "r") as f:
-    seat_info = f.read()
-
-translation_table = {"B": "1", "F": "0", "R": "1", "L": "0"}
-seat_numbers = {
-    int(seat_bin, 2)
-    for seat_bin
-    in seat_info.translate(str.maketrans(translation_table)).split()
-}
-empty_seats = set(range(min(seat_numbers), max(seat_numbers)+1)).difference(seat_numbers)
-empty_seat = empty_seats.pop()
-
-print(f"Answer 1: {max(seat_numbers)}")
-print(f"Answer 2: {empty_seat}")
+import io
+from typing import BinaryIO, Iterable, Iterator
+
+import numpy as np
+
+from aoctools.grid import iter_blocks, lookup_table, read_grid
+from aoctools.inputs import Puzzle
+
+SEAT_BITS = lookup_table({"B": 1, "R": 1})
+
+
+def seat_ids(boarding_passes: str | bytes | memoryview) -> np.ndarray:
+    """Decode boarding passes, one per line, to seat ids by reading them as binary numbers"""
+    bits = read_grid(boarding_passes, SEAT_BITS)
+    return bits @ (1 << np.arange(bits.shape[1] - 1, -1, -1))
+
+
+def iter_seat_ids(file: BinaryIO) -> Iterator[np.ndarray]:
+    """Yield the seat ids of a file of boarding passes per block of whole lines"""
+    for block in iter_blocks(file):
+        yield seat_ids(block)
+
+
+def xor_up_to(n: int) -> int:
+    """XOR of all integers from 0 up to and including n"""
+    return (n, 1, n + 1, 0)[n % 4]
+
+
+def highest_and_missing_seat(seat_id_blocks: Iterable[np.ndarray]) -> tuple[int, int]:
+    """
+    Highest seat id and the single id missing from the contiguous range of seat ids
+
+    Only the minimum, maximum, count and XOR of the ids are kept. XOR-ing the full range with the
+    ids that are present leaves the missing id.
+    """
+    lowest, highest, n_seats, xor_seats = None, None, 0, 0
+    for ids in seat_id_blocks:
+        block_lowest, block_highest = int(ids.min()), int(ids.max())
+        lowest = block_lowest if lowest is None else min(lowest, block_lowest)
+        highest = block_highest if highest is None else max(highest, block_highest)
+        n_seats += ids.size
+        xor_seats ^= int(np.bitwise_xor.reduce(ids))
+    if highest is None or n_seats != highest - lowest:
+        raise ValueError("seat ids should form a contiguous range with exactly one seat missing")
+    return highest, xor_seats ^ xor_up_to(highest) ^ xor_up_to(lowest - 1)
+
+
+def part_1_and_2(input_data: str) -> tuple[int, int]:
+    return highest_and_missing_seat(iter_seat_ids(io.BytesIO(input_data.encode())))
+
+
+def main():
+    puzzle = Puzzle(day=5, year=2020)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a, puzzle.answer_b = part_1_and_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -93,20 +93,75 @@ For each group, count the number of questions to which everyone answered "yes".
 those counts?
 
 """
-with open("solutions/2020/day6/input.txt", "r") as f:
-    customs_declarations_data = f.read()
-
-groups_answers_any = [set(group_declarations.replace("\n", "")) for group_declarations in customs_declarations_data.split("\n\n")]
-answer_any_count = sum(len(group_answers) for group_answers in groups_answers_any)
-
-groups_answers_all = []
-for group_declarations in customs_declarations_data.split("\n\n"):
-    first_declarations, *others_declarations = group_declarations.split()
-    group_declaration_all = set(first_declarations)
-    for individual_declaration in others_declarations:
-        group_declaration_all.intersection_update(individual_declaration)
-    groups_answers_all.append(group_declaration_all)
-answer_all_count = sum(len(group_answers) for group_answers in groups_answers_all)
-
-print(f"Answer 1: {answer_any_count}")
-print(f"Answer 2: {answer_all_count}")
+import io
+from string import ascii_lowercase
+from typing import BinaryIO
+
+import numpy as np
+
+from aoctools.grid import NEWLINE, iter_blocks, lookup_table
+from aoctools.inputs import Puzzle
+
+QUESTION_BITS = lookup_table(
+    {question: 1 << bit for bit, question in enumerate(ascii_lowercase)}, dtype=np.uint32
+)
+
+
+def group_answers(block: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """
+    26-bit masks of the questions anyone and everyone in each group of the block answered yes to
+
+    The masks of the persons are OR reductions of the question bits of their letters, those of
+    the groups OR and AND reductions of the person masks.
+    """
+    codes = np.frombuffer(block.strip(), dtype=np.uint8)
+    newlines = codes == NEWLINE
+    blank_lines = np.zeros_like(newlines)
+    blank_lines[1:] = newlines[1:] & newlines[:-1]
+    letters = ~newlines
+    person_of_letter = np.cumsum(newlines)[letters]
+    group_of_letter = np.cumsum(blank_lines)[letters]
+
+    first_letters = np.flatnonzero(np.diff(person_of_letter, prepend=-1))
+    persons = np.bitwise_or.reduceat(QUESTION_BITS[codes[letters]], first_letters)
+    group_of_person = group_of_letter[first_letters]
+    first_persons = np.flatnonzero(np.diff(group_of_person, prepend=-1))
+    return (
+        np.bitwise_or.reduceat(persons, first_persons),
+        np.bitwise_and.reduceat(persons, first_persons),
+    )
+
+
+def count_questions(masks: np.ndarray) -> int:
+    """Total number of questions in the masks, counted as the set bits of their bytes"""
+    return int(np.unpackbits(masks.view(np.uint8)).sum(dtype=int))
+
+
+def count_answers(file: BinaryIO) -> tuple[int, int]:
+    """
+    Sum of the number of questions anyone and everyone in a group answered
+
+    Both sums are made in a single pass that reads the file in blocks of whole groups.
+    """
+    anyone = everyone = 0
+    for block in iter_blocks(file, separator=b"\n\n"):
+        anyone_masks, everyone_masks = group_answers(block)
+        anyone += count_questions(anyone_masks)
+        everyone += count_questions(everyone_masks)
+    return anyone, everyone
+
+
+def part_1_and_2(input_data: str) -> tuple[int, int]:
+    return count_answers(io.BytesIO(input_data.encode()))
+
+
+def main():
+    puzzle = Puzzle(day=6, year=2020)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a, puzzle.answer_b = part_1_and_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -78,36 +78,99 @@ How many individual bags are required inside your single shiny gold bag?
 
 """
 import re
-import networkx as nx
 
-with open("solutions/2020/day7/input.txt", "r") as f:
-    bag_containment_rules = f.read().split("\n")
+from aoctools.inputs import Puzzle
 
 node_of_interest = "shiny gold"
-
-G = nx.DiGraph()
-amount_colorbag_pattern = re.compile(r"(?P<amount>\d) (?P<colorbag>\w* \w*) bags?")
-for rule in bag_containment_rules:
-    if rule == '':
-        continue
-    bag, contains = rule.strip(".").split(" bags contain ")
-    if contains == "no other bags":
-        continue
-    else:
-        for inside_bag in contains.split(", "):
-            match = amount_colorbag_pattern.match(inside_bag)
-            G.add_edge(bag, match["colorbag"], count=int(match["amount"]))
-
-nodes_to_traverse = {node_of_interest: 1}
-total = 0
-while nodes_to_traverse:
-    new_nodes_to_traverse = {}
-    for node, count in nodes_to_traverse.items():
-        for downstream_node, attr in G[node].items():
-            new_nodes_to_traverse[downstream_node] = count * attr["count"] + new_nodes_to_traverse.get(downstream_node, 0)
-    total += sum(new_nodes_to_traverse.values())
-    print(str(total), new_nodes_to_traverse)
-    nodes_to_traverse = new_nodes_to_traverse
-
-print(f"Answer 1: {len(list(nx.dfs_postorder_nodes(G.reverse(), node_of_interest))) - 1}")
-print(f"Answer 2: {total}")
+amount_colorbag_pattern = re.compile(r"(?P<amount>\d+) (?P<colorbag>\w* \w*) bags?")
+
+
+class BagRules:
+    """
+    Bag containment rules with interned colour ids
+
+    Holds the contents of every colour as (colour id, count) pairs and a reverse index from a
+    colour to the colours that directly contain it. Counts of bags inside a colour are memoized,
+    so any number of queries take O(V+E) together.
+    """
+
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.contents: list[list[tuple[int, int]]] = []
+        self.containers: list[list[int]] = []
+        self._inside_counts: list[int | None] = []
+
+    def intern(self, colour: str) -> int:
+        """Return the id of a colour, adding it when it is new"""
+        if colour not in self.ids:
+            self.ids[colour] = len(self.ids)
+            self.contents.append([])
+            self.containers.append([])
+            self._inside_counts.append(None)
+        return self.ids[colour]
+
+    @classmethod
+    def from_rules(cls, input_data: str) -> "BagRules":
+        rules = cls()
+        for rule in input_data.splitlines():
+            if not rule:
+                continue
+            bag, contains = rule.strip(".").split(" bags contain ")
+            bag_id = rules.intern(bag)
+            for match in amount_colorbag_pattern.finditer(contains):
+                inside_id = rules.intern(match["colorbag"])
+                rules.contents[bag_id].append((inside_id, int(match["amount"])))
+                rules.containers[inside_id].append(bag_id)
+        return rules
+
+    def count_containers(self, colour: str) -> int:
+        """Number of colours that eventually contain at least one bag of colour"""
+        start = self.ids[colour]
+        seen = {start}
+        stack = [start]
+        while stack:
+            for container in self.containers[stack.pop()]:
+                if container not in seen:
+                    seen.add(container)
+                    stack.append(container)
+        return len(seen) - 1
+
+    def count_inside(self, colour: str) -> int:
+        """Total number of bags inside a bag of colour, with an iterative memoized post-order"""
+        start = self.ids[colour]
+        stack = [start]
+        while stack:
+            bag_id = stack[-1]
+            if self._inside_counts[bag_id] is not None:
+                stack.pop()
+                continue
+            pending = [inside for inside, _ in self.contents[bag_id] if self._inside_counts[inside] is None]
+            if pending:
+                stack.extend(pending)
+                continue
+            self._inside_counts[bag_id] = sum(
+                count * (1 + self._inside_counts[inside]) for inside, count in self.contents[bag_id]
+            )
+            stack.pop()
+        return self._inside_counts[start]
+
+
+def part_1(input_data) -> int:
+    return BagRules.from_rules(input_data).count_containers(node_of_interest)
+
+
+def part_2(input_data) -> int:
+    return BagRules.from_rules(input_data).count_inside(node_of_interest)
+
+
+def main():
+    puzzle = Puzzle(day=7, year=2020)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -113,6 +113,16 @@ Fix the program so that it terminates normally by changing exactly one jmp (to n
 """
 
 
+from collections import deque
+from typing import Iterable
+
+from aoctools.inputs import Puzzle
+
+ACC, JMP, NOP = range(3)
+OPCODES = {"acc": ACC, "jmp": JMP, "nop": NOP}
+FLIPPED = {JMP: NOP, NOP: JMP}
+
+
 class InfiniteLoopEncountered(RuntimeError):
     """Program encountered an infinite loop and is shutting down"""
     def __init__(self, message, acc):
@@ -120,59 +130,96 @@ class InfiniteLoopEncountered(RuntimeError):
         self.acc = acc
 
 
-def execute_line(line: str, tracker: list, line_no: int, acc: int):
-    """Execute line and accumulate acc"""
-    tracker[line_no] = True
-    match line.split():
-        case "acc", value:
-            return acc + int(value), line_no + 1
-        case "jmp", value:
-            return acc, line_no + int(value)
-        case "nop", value:
-            return acc, line_no + 1
-        case _:
+def compile_program(instructions: Iterable[str]) -> tuple[list[int], list[int]]:
+    """Compile the instructions once into lists of int opcodes and arguments"""
+    opcodes, args = [], []
+    for line in instructions:
+        operation, value = line.split()
+        if operation not in OPCODES:
             raise ValueError(f"No valid action in line: {line}")
+        opcodes.append(OPCODES[operation])
+        args.append(int(value))
+    return opcodes, args
 
 
-def run_program(instructions: list[str]) -> int:
-    """Run program from instructions and return acc"""
+def next_line_no(opcode: int, arg: int, line_no: int) -> int:
+    return line_no + arg if opcode == JMP else line_no + 1
+
+
+def run_program(opcodes: list[int], args: list[int], flip: int | None = None) -> int:
+    """Run the compiled program and return acc, optionally with the opcode at line flip flipped"""
     acc, line_no = 0, 0
-    line_tracker = [False] * len(instructions)
-    while True:
-        if line_no == len(instructions):
-            return acc
-        if line_tracker[line_no]:
+    visited = [False] * len(opcodes)
+    while line_no != len(opcodes):
+        if not 0 <= line_no < len(opcodes) or visited[line_no]:
             raise InfiniteLoopEncountered(f"infinite loop at line {line_no}", acc=acc)
-        acc, line_no = execute_line(instructions[line_no], line_tracker, line_no, acc)
+        visited[line_no] = True
+        opcode = opcodes[line_no]
+        if line_no == flip:
+            opcode = FLIPPED[opcode]
+        if opcode == ACC:
+            acc += args[line_no]
+        line_no = next_line_no(opcode, args[line_no], line_no)
+    return acc
+
+
+def terminating_lines(opcodes: list[int], args: list[int]) -> set[int]:
+    """Lines from which the unmodified program terminates, found backwards from the end"""
+    n_lines = len(opcodes)
+    came_from = [[] for _ in range(n_lines + 1)]
+    for line_no, (opcode, arg) in enumerate(zip(opcodes, args)):
+        target = next_line_no(opcode, arg, line_no)
+        if 0 <= target <= n_lines:
+            came_from[target].append(line_no)
+    terminating = {n_lines}
+    queue = deque([n_lines])
+    while queue:
+        for line_no in came_from[queue.popleft()]:
+            if line_no not in terminating:
+                terminating.add(line_no)
+                queue.append(line_no)
+    return terminating
+
+
+def find_repair(opcodes: list[int], args: list[int]) -> int:
+    """
+    Line of the single jmp or nop that has to be flipped for the program to terminate
+
+    Only lines on the path of the unmodified program can change its course, the one to flip is the
+    one that jumps into a line from which the program terminates.
+    """
+    terminating = terminating_lines(opcodes, args)
+    visited = set()
+    line_no = 0
+    while line_no not in visited and line_no != len(opcodes):
+        visited.add(line_no)
+        opcode, arg = opcodes[line_no], args[line_no]
+        if opcode in FLIPPED and next_line_no(FLIPPED[opcode], arg, line_no) in terminating:
+            return line_no
+        line_no = next_line_no(opcode, arg, line_no)
+    raise ValueError("no single jmp or nop flip makes the program terminate")
+
+
+def part_1(input_data) -> int:
+    try:
+        return run_program(*compile_program(input_data.splitlines()))
+    except InfiniteLoopEncountered as e:
+        return e.acc
 
 
-if __name__ == "__main__":
+def part_2(input_data) -> int:
+    opcodes, args = compile_program(input_data.splitlines())
+    return run_program(opcodes, args, flip=find_repair(opcodes, args))
 
-    with open("solutions/2020/day8/input.txt", "r") as f:
-        program_instructions = [*f.read().splitlines()]
 
-    mutation_lookup = {"nop": "jmp", "jmp": "nop"}
+def main():
+    puzzle = Puzzle(day=8, year=2020)
 
-    try:
-        acc1 = run_program(program_instructions)
-    except InfiniteLoopEncountered as e:
-        acc1 = e.acc
-
-    acc2 = None
-    mutation_index = 0
-    while True:
-        original_operation, value = program_instructions[mutation_index].split()
-        if original_operation not in mutation_lookup:
-            mutation_index += 1
-            continue
-        new_operation = mutation_lookup[original_operation]
-        program_instructions[mutation_index] = program_instructions[mutation_index].replace(original_operation, new_operation)
-        try:
-            acc2 = run_program(program_instructions)
-            break
-        except InfiniteLoopEncountered:
-            program_instructions[mutation_index] = program_instructions[mutation_index].replace(new_operation, original_operation)
-            mutation_index += 1
-
-    print(f"Answer 1: {acc1}")
-    print(f"Answer 2: {acc2}")
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -100,30 +100,75 @@ range; in this example, these are 15 and 47, producing 62.
 What is the encryption weakness in your XMAS-encrypted list of numbers?
 """
 
-with open("solutions/2020/day9/input.txt", "r") as f:
-    numbers = [*map(int, f.read().split())]
-
-no_sum_in_preamble_number, encryption_weakness = None, None
-
-preamble_size = 25
-for i, number in enumerate(numbers[preamble_size:]):
-    preamble = numbers[i:i+preamble_size]
-    preamble_has_sum = any([number - element in preamble for element in preamble])
-    if not preamble_has_sum:
-        no_sum_in_preamble_number = number
-        break
-
-for start in range(numbers.index(no_sum_in_preamble_number)):
-    end = start
-    sum_of_range = 0
-    while sum_of_range < no_sum_in_preamble_number:
-        end += 1
-        sum_of_range = sum(numbers[start:end+1])
-
-    if sum_of_range == no_sum_in_preamble_number:
-        encryption_weakness = min(numbers[start:end+1]) + max(numbers[start:end+1])
-        break
-
-
-print(f"Answer 1: {no_sum_in_preamble_number}")
-print(f"Answer 2: {encryption_weakness}")
+from collections import Counter, deque
+from typing import Iterable
+
+from aoctools.inputs import Puzzle
+
+PREAMBLE_SIZE = 25
+
+
+def find_invalid_number(numbers: Iterable[int], preamble_size: int = PREAMBLE_SIZE) -> int | None:
+    """
+    Find the first number that is not the sum of two different numbers of the preamble before it
+
+    The preamble is kept as a rolling window with a multiset of its numbers, so every number is
+    checked in O(preamble_size) without slicing.
+    """
+    window = deque()
+    counts = Counter()
+    for number in numbers:
+        if len(window) == preamble_size:
+            if not any(
+                counts[number - element] > (number - element == element) for element in counts
+            ):
+                return number
+            oldest = window.popleft()
+            counts[oldest] -= 1
+            if not counts[oldest]:
+                del counts[oldest]
+        window.append(number)
+        counts[number] += 1
+    return None
+
+
+def find_encryption_weakness(numbers: Iterable[int], target: int) -> int | None:
+    """
+    Sum of the smallest and largest number of a contiguous range of at least two numbers that sums
+    to target, for positive numbers
+
+    A single pass with two pointers: numbers are added at the end of the range and removed from the
+    start while the range sum exceeds the target.
+    """
+    contiguous_range = deque()
+    range_sum = 0
+    for number in numbers:
+        contiguous_range.append(number)
+        range_sum += number
+        while range_sum > target:
+            range_sum -= contiguous_range.popleft()
+        if range_sum == target and len(contiguous_range) > 1:
+            return min(contiguous_range) + max(contiguous_range)
+    return None
+
+
+def part_1(input_data) -> int:
+    return find_invalid_number(map(int, input_data.split()))
+
+
+def part_2(input_data) -> int:
+    numbers = [*map(int, input_data.split())]
+    return find_encryption_weakness(numbers, target=find_invalid_number(numbers))
+
+
+def main():
+    puzzle = Puzzle(day=9, year=2020)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -105,24 +105,65 @@ In this example, there are 5 sums that are larger than the previous sum.
 Consider sums of a three-measurement sliding window. How many sums are larger than the previous sum?
 
 """
+import io
+from collections import deque
+from typing import BinaryIO, Iterable, Iterator
+
 import numpy as np
 
+from aoctools.grid import iter_blocks
+from aoctools.inputs import Puzzle
 
-def n_down(depth_arr: list[int], window: int = 1) -> int:
-    """Count consecutive down with a moving average on depth_arr"""
-    depth_arr = np.array(depth_arr)
-    return (depth_arr[window:] - depth_arr[:-window] > 0).sum()
 
+def n_down(depths: Iterable[int], window: int = 1) -> int:
+    """Count consecutive down with a moving sum of window depths, keeping only the last window"""
+    previous = deque(maxlen=window)
+    count = 0
+    for depth in depths:
+        if len(previous) == window and depth > previous[0]:
+            count += 1
+        previous.append(depth)
+    return count
+
+
+def iter_depth_blocks(file: BinaryIO) -> Iterator[np.ndarray]:
+    """Yield the depths of a file per block of whole lines"""
+    for block in iter_blocks(file):
+        yield np.fromstring(block.decode(), dtype=int, sep=" ")
+
+
+def n_down_chunked(file: BinaryIO, window: int = 1) -> int:
+    """
+    Count consecutive down with a moving sum of window depths, reading a file in blocks
+
+    The depths of a block are compared at once, the last window depths are carried over to the
+    next block to compare its first depths with.
+    """
+    carried = np.empty(0, dtype=int)
+    count = 0
+    for block_depths in iter_depth_blocks(file):
+        depths = np.concatenate([carried, block_depths])
+        count += int((depths[window:] > depths[:-window]).sum())
+        carried = depths[-window:]
+    return count
 
-if __name__ == "__main__":
-    # Read input and convert to list of int
-    with open("solutions/2021/day1/input.txt", "r") as f:
-        depths = list(map(int, f.read().split()))
 
-    # Part 1
-    answer_1 = n_down(depths)
-    print(f"Answer 1 should be: {answer_1}")
+def part_1(input_data) -> int:
+    return n_down_chunked(io.BytesIO(input_data.encode()))
 
-    # Part 2
-    answer_2 = n_down(depths, window=3)
-    print(f"Answer 2 should be: {answer_2}")
+
+def part_2(input_data) -> int:
+    return n_down_chunked(io.BytesIO(input_data.encode()), window=3)
+
+
+def main():
+    puzzle = Puzzle(day=1, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -133,6 +133,8 @@ scores. What is the middle score?
 from enum import Enum
 import numpy as np
 
+from aoctools.inputs import Puzzle
+
 BRACKETS = {"[": "]", "<": ">", "(": ")", "{": "}"}
 IllegalChar = Enum("IllegalChar", {")": 3, "]": 57, "}": 1197, ">": 25137})
 CompleteChar = Enum("IllegalChar", {")": 1, "]": 2, "}": 3, ">": 4})
@@ -159,17 +161,27 @@ def calc_autocomplete_score(tracker):
     return score
 
 
-if __name__ == "__main__":
+def part_1(input_data) -> int:
+    return sum(calc_illegal_char_score(line) for line in input_data.splitlines())
 
-    with open("solutions/2021/day10/input.txt", "r") as f:
-        syntax_lines = f.read().splitlines()
 
-    invalid_syntax_scores = [calc_illegal_char_score(line) for line in syntax_lines]
+def part_2(input_data) -> int:
     autocomplete_scores = [
         calc_illegal_char_score(line, autocomplete=True)
-        for line, invalid_score in zip(syntax_lines, invalid_syntax_scores)
-        if invalid_score == 0
+        for line in input_data.splitlines()
+        if calc_illegal_char_score(line) == 0
     ]
+    return int(np.median(autocomplete_scores))
+
+
+def main():
+    puzzle = Puzzle(day=10, year=2021)
 
-    print(f"Answer 1: {sum(invalid_syntax_scores)}")
-    print(f"Answer 2: {np.median(autocomplete_scores)}")
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
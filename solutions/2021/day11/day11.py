@@ -359,34 +359,55 @@ After step 195:
 If you can calculate the exact moments when the octopuses will all flash simultaneously, you should be able to navigate through the cavern. What is the first step during which all octopuses flash?
 
 """
+from typing import Iterator
+
 import numpy as np
-from scipy import ndimage
 
+from aoctools.grid import DIGITS, read_grid
+from aoctools.inputs import Puzzle
 
-if __name__ == "__main__":
 
-    with open("solutions/2021/day11/input.txt", "r") as f:
-        octopus_energy = np.array([[*map(int, line)] for line in f.read().splitlines()])
+def simulate_flashes(input_data: str) -> Iterator[np.ndarray]:
+    """Step the octopus energy levels forever and yield the mask of flashed octopuses per step"""
+    from scipy import ndimage
 
-    total_flashes, step, total_flashes_100 = 0, 0, 0
+    octopus_energy = read_grid(input_data, DIGITS)
     while True:
-        step += 1
         octopus_energy += 1
         already_flashed = np.zeros_like(octopus_energy, dtype=bool)
         while True:
             flashing = (octopus_energy > 9) & ~already_flashed
             flash_fallout = ndimage.convolve(flashing.astype(int), weights=np.ones((3, 3)), mode="constant").astype(int)
             if not np.any(flash_fallout):
-                total_flashes += np.sum(already_flashed)
                 octopus_energy[already_flashed] = 0
                 break
             octopus_energy += flash_fallout
             already_flashed |= flashing
+        yield already_flashed
+
+
+def part_1(input_data) -> int:
+    total_flashes = 0
+    for step, flashed in enumerate(simulate_flashes(input_data), start=1):
+        total_flashes += np.sum(flashed)
         if step == 100:
-            total_flashes_100 = total_flashes
-        if np.all(already_flashed):
-            synchronize_step = step
-            break
+            return int(total_flashes)
+
+
+def part_2(input_data) -> int:
+    for step, flashed in enumerate(simulate_flashes(input_data), start=1):
+        if np.all(flashed):
+            return step
 
-    print(f"Answer 1: {total_flashes_100}")
-    print(f"Answer 2: {synchronize_step}")
+
+def main():
+    puzzle = Puzzle(day=11, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
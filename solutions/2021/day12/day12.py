@@ -114,10 +114,9 @@ start-RW
 How many paths through this cave system are there that visit small caves at most once?
 
 """
-import networkx as nx
-
 
 if __name__ == "__main__":
+    import networkx as nx
 
     with open("solutions/2021/day12/input.txt", "r") as f:
         edges = [edge.split('i') for edge in f.read().splitlines()]
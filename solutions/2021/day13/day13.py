@@ -145,6 +145,8 @@ from typing import List
 
 import numpy as np
 
+from aoctools.inputs import Puzzle
+
 Coord = namedtuple("Coord", ["x", "y"])
 Fold = namedtuple("Fold", ["direction", "value"])
 fold_pattern = re.compile(r"fold along (?P<direction>[xy])=(?P<value>\d{1,4})")
@@ -188,31 +190,47 @@ def fold_paper(image: np.ndarray, direction: str, value: int) -> np.ndarray:
     return folded_image
 
 
-if __name__ == "__main__":
-
-    with open("solutions/2021/day13/input.txt", "r") as f:
-        coords_txt, folds_txt = f.read().split("\n\n")
-
+def read_instructions(input_data: str) -> tuple[np.ndarray, list[Fold]]:
+    """Read the dotted transparent paper and the fold instructions"""
+    coords_txt, folds_txt = input_data.split("\n\n")
     coords = [Coord(*map(int, coord.split(","))) for coord in coords_txt.splitlines()]
     folds = [
         Fold(match["direction"], int(match["value"])) for match in fold_pattern.finditer(folds_txt)
     ]
-    dotted_transparent_paper = create_coord_mask(coords)
+    return create_coord_mask(coords), folds
+
+
+def part_1(input_data) -> int:
+    dotted_transparent_paper, folds = read_instructions(input_data)
     first_folded_paper = fold_paper(
         dotted_transparent_paper,
         direction=folds[0].direction,
         value=folds[0].value,
     )
-    folded_paper = first_folded_paper
-    for fold in folds[1:]:
+    return int(np.sum(first_folded_paper))
+
+
+def part_2(input_data) -> str:
+    folded_paper, folds = read_instructions(input_data)
+    for fold in folds:
         folded_paper = fold_paper(
             folded_paper,
             direction=fold.direction,
             value=fold.value,
         )
-
-    folded_letters = "\n".join(
+    return "\n".join(
         ("".join("$$" if char else "  " for char in line) for line in folded_paper)
     )
-    print(f"Answer 1: {np.sum(first_folded_paper)}")
-    print(f"Answer 2:\n{folded_letters}")
+
+
+def main():
+    puzzle = Puzzle(day=13, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}\n{puzzle.answer_b}")
+
+
+if __name__ == "__main__":
+    main()
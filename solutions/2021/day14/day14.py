@@ -75,6 +75,8 @@ from collections import Counter
 import itertools
 from typing import Dict, Tuple
 
+from aoctools.inputs import Puzzle
+
 
 def mutate_polymer(polymer, pattern_mapper):
     """
@@ -111,10 +113,9 @@ def distill_final_count(duo_counter: Counter, polymer: str) -> Counter:
     return final_counter
 
 
-if __name__ == "__main__":
-
-    with open("solutions/2021/day14/input.txt", "r") as f:
-        template, pattern_mapper_txt = f.read().split("\n\n")
+def polymer_element_range(input_data: str, steps: int) -> int:
+    """Difference between the most and least common element after the pair insertion steps"""
+    template, pattern_mapper_txt = input_data.split("\n\n")
 
     pattern_combinations = [pattern.split(" -> ") for pattern in pattern_mapper_txt.splitlines()]
     pattern_mapper_ = {pattern[0]: pattern[1] for pattern in pattern_combinations}
@@ -125,12 +126,28 @@ if __name__ == "__main__":
     duo_counts_ = Counter("".join(pair) for pair in itertools.pairwise(template))
     triple_counts_ = Counter({mutation_mapper_[duo]: count for duo, count in duo_counts_.items()})
 
-    for step in range(1, 10+1):
-        duo_counts_, triple_counts_ = update_polymer_counters(triple_counts_, mutation_mapper_, inverse_mutation_mapper_)
-    polymer_counter_10 = distill_final_count(duo_counts_, template)
-    for step in range(11, 40+1):
+    for step in range(1, steps+1):
         duo_counts_, triple_counts_ = update_polymer_counters(triple_counts_, mutation_mapper_, inverse_mutation_mapper_)
-    polymer_counter_40 = distill_final_count(duo_counts_, template)
+    polymer_counter = distill_final_count(duo_counts_, template)
+    return max(polymer_counter.values()) - min(polymer_counter.values())
+
+
+def part_1(input_data) -> int:
+    return polymer_element_range(input_data, steps=10)
+
 
-    print(f"Answer 1: {max(polymer_counter_10.values()) - min(polymer_counter_10.values())}")
-    print(f"Answer 2: {max(polymer_counter_40.values()) - min(polymer_counter_40.values())}")
+def part_2(input_data) -> int:
+    return polymer_element_range(input_data, steps=40)
+
+
+def main():
+    puzzle = Puzzle(day=14, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -180,9 +180,11 @@ Using the full map, what is the lowest total risk of any path from the top left
 
 """
 import numpy as np
-import networkx as nx
 import itertools
 
+from aoctools.grid import DIGITS, read_grid
+from aoctools.inputs import Puzzle
+
 
 def node_name(row, col):
     """Return a unique node name"""
@@ -191,6 +193,8 @@ def node_name(row, col):
 
 def find_lowest_risk_path(risk_image: np.ndarray) -> list[tuple[int, ...]]:
     """Find the path with the lowest overall risk from top left to bottom right"""
+    import networkx as nx
+
     look_directions = ((-1, 0), (0, 1), (1, 0), (0, -1))
     n_rows, n_cols = risk_image.shape
     G = nx.MultiDiGraph()
@@ -210,19 +214,31 @@ def find_lowest_risk_path(risk_image: np.ndarray) -> list[tuple[int, ...]]:
     return lowest_risk_path
 
 
-if __name__ == "__main__":
+def part_1(input_data) -> int:
+    risks = read_grid(input_data, DIGITS)
+    path_risk = find_lowest_risk_path(risks)
+    return int(sum([risks[loc] for loc in path_risk[1:]]))
 
-    with open("solutions/2021/day15/input.txt", "r") as f:
-        risks = np.array([[*map(int, line)] for line in f.read().splitlines()])
 
+def part_2(input_data) -> int:
+    risks = read_grid(input_data, DIGITS)
     greater_risk = np.concatenate([
             np.concatenate([(risks + grow_row + grow_col - 1) % 9 + 1
                             for grow_col in range(5)], axis=1)
             for grow_row in range(5)], axis=0
     )
-
-    path_risk = find_lowest_risk_path(risks)
     path_greater_risk = find_lowest_risk_path(greater_risk)
+    return int(sum([greater_risk[loc] for loc in path_greater_risk[1:]]))
 
-    print(f"Answer 1: {sum([risks[loc] for loc in path_risk[1:]])}")
-    print(f"Answer 2: {sum([greater_risk[loc] for loc in path_greater_risk[1:]])}")
+
+def main():
+    puzzle = Puzzle(day=15, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -208,6 +208,8 @@ from math import prod
 from operator import lt, gt, eq
 from typing import Generator
 
+from aoctools.inputs import Puzzle
+
 OPERATOR_MAP = {0: sum, 1: prod, 2: min, 3: max, 5: gt, 6: lt, 7: eq}
 
 
@@ -309,14 +311,29 @@ def read_packet(binary_str: str) -> tuple[Packet, int]:
     return packet, bits_read
 
 
-if __name__ == "__main__":
+def read_transmission(input_data: str) -> Packet:
+    """Read the outermost packet from the hexadecimal transmission"""
+    binary = f"{int(input_data, 16):b}"
+    packet, _bits_read = read_packet(binary)
+    return packet
+
+
+def part_1(input_data) -> int:
+    return read_transmission(input_data).version_sum()
+
 
-    with open("solutions/2021/day16/input.txt", "r") as f:
-        data = f.read()
+def part_2(input_data) -> int:
+    return read_transmission(input_data).packet_value()
 
-    binary = f"{int(data, 16):b}"
-    packet_, bits_read_ = read_packet(binary)
 
-    print(packet_, "==", packet_.packet_value())
-    print(f"Answer 1: {packet_.version_sum()}")
-    print(f"Answer 2: {packet_.packet_value()}")
+def main():
+    puzzle = Puzzle(day=16, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -138,9 +138,7 @@ import re
 from itertools import product
 from math import ceil, floor
 
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
+from aoctools.inputs import Puzzle
 
 
 def trajectory(xv, yv, xmax, ymin):
@@ -156,31 +154,51 @@ def trajectory(xv, yv, xmax, ymin):
     return positions
 
 
-if __name__ == "__main__":
-
-    with open("solutions/2021/day17/input.txt", "r") as f:
-        data = f.read()
+def read_target_area(input_data: str) -> tuple[int, int, int, int]:
+    """Read xmin, xmax, ymin and ymax of the target area"""
+    xrange = re.search(r"x=(?P<xmin>\d{3})\.\.(?P<xmax>\d{3})", input_data)
+    yrange = re.search(r"y=(?P<ymin>-?\d{2,3})\.\.(?P<ymax>-?\d{2,3})", input_data)
+    return int(xrange["xmin"]), int(xrange["xmax"]), int(yrange["ymin"]), int(yrange["ymax"])
 
-    xrange = re.search(r"x=(?P<xmin>\d{3})\.\.(?P<xmax>\d{3})", data)
-    yrange = re.search(r"y=(?P<ymin>-?\d{2,3})\.\.(?P<ymax>-?\d{2,3})", data)
-    xmin, xmax = int(xrange["xmin"]), int(xrange["xmax"])
-    ymin, ymax = int(yrange["ymin"]), int(yrange["ymax"])
 
+def minimum_x_velocity(xmin: int, xmax: int) -> int:
+    """Initial x velocity for which the x position stops exactly on the platform"""
     xv_min = ceil((-1 + (1 - 8*-xmin) ** 0.5) / 2)  # x position stops exactly on platform
     xv_max = floor((-1 + (1 - 8*-xmax) ** 0.5) / 2)  # x position stops exactly on platform
     assert xv_min == xv_max  # assume that all puzzle inputs meet this criterion
+    return xv_min
+
+
+def part_1(input_data) -> int:
+    xmin, xmax, ymin, ymax = read_target_area(input_data)
 
     # y will always get back to zero one step before it hits the platform. In order to still hit the
     # platform, the velocity needs to not overshoot which is (-ymin + 1) in case of negative ymin
-    xv, yv = xv_min, abs(ymin + 1)
+    xv, yv = minimum_x_velocity(xmin, xmax), abs(ymin + 1)
     x, y = zip(*trajectory(xv, yv, xmax, ymin))
+    return max(y)
+
 
-    print(f"Answer 1: {max(y)}")
+def part_2(input_data) -> int:
+    xmin, xmax, ymin, ymax = read_target_area(input_data)
+    xv_min, yv_max = minimum_x_velocity(xmin, xmax), abs(ymin + 1)
 
     initial_velocities = []
-    for xv, yv in product(range(xv_min, xmax + 1), range(ymin, yv + 1)):
+    for xv, yv in product(range(xv_min, xmax + 1), range(ymin, yv_max + 1)):
         x, y = zip(*trajectory(xv, yv, xmax, ymin))
         if xmin <= x[-1] <= xmax and ymin <= y[-1] <= ymax:
             initial_velocities.append((xv, yv))
+    return len(initial_velocities)
 
-    print(f"Answer 2: {len(initial_velocities)}")
+
+def main():
+    puzzle = Puzzle(day=17, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -198,13 +198,11 @@ the magnitude of the final sum?
 
 """
 from typing import Union
-import networkx as nx
 
 
 class SnailFish:
     def __init__(self, number: list[any]):
         self.number = number
-        self.tree = nx.Graph
 
     def __add__(self, other: 'SnailFish'):
         return SnailFish([self.number, other.number])
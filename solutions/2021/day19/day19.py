@@ -401,6 +401,8 @@ from itertools import chain, product
 import numpy as np
 from io import StringIO
 
+from aoctools.inputs import Puzzle
+
 
 start_orientations = [("x", "y", "z"), ("y", "z", "x"), ("z", "x", "y")]
 flipped_orientations = [(o[1], o[0], f"-{o[2]}") for o in start_orientations]
@@ -495,13 +497,10 @@ def get_scanner_position(
     return position, orientation
 
 
-if __name__ == "__main__":
-
-    with open("solutions/2021/day19/input.txt", "r") as f:
-        scanner_data = f.read().split("\n\n")
-
+def locate_scanners(input_data: str) -> tuple[Scanner, list[Scanner]]:
+    """Locate all scanners relative to scanner 0 and return it with all beacons merged in"""
     scanners = []
-    for i, s in enumerate(scanner_data):
+    for i, s in enumerate(input_data.split("\n\n")):
         scanners.append(Scanner(i, np.loadtxt(StringIO(s), dtype=int, skiprows=1, delimiter=",")))
     scanner_0 = scanners.pop(0)
     scanner_0.position = (0, 0, 0)
@@ -519,11 +518,25 @@ if __name__ == "__main__":
             finished_scanners.append(scanners.pop(idx))
         except NotEnoughBeacons:
             idx += 1
+    return scanner_0, finished_scanners
+
 
-    largest_manhattan_distance = max(
+def part_1_and_2(input_data: str) -> tuple[int, int]:
+    scanner_0, finished_scanners = locate_scanners(input_data)
+    largest_distance = int(max(
         scanner_1.manhattan_distance(scanner_2)
         for scanner_1, scanner_2 in product(finished_scanners, finished_scanners)
-    )
+    ))
+    return len(scanner_0), largest_distance
 
-    print(f"Answer 1: {len(scanner_0)}")
-    print(f"Answer 2: {largest_manhattan_distance}")
+
+def main():
+    puzzle = Puzzle(day=19, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a, puzzle.answer_b = part_1_and_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -39,34 +39,22 @@ Calculate the horizontal position and depth you would have after following the p
 do you get if you multiply your final horizontal position by your final depth?
 
 """
-from operator import add, sub
+from dataclasses import dataclass
 
+import numpy as np
 
+from aoctools.inputs import Puzzle
+
+DIRECTIONS = ("forward", "down", "up")
+FORWARD, DOWN, UP = range(len(DIRECTIONS))
+
+
+@dataclass
 class SubmarinePosition:
     """SubmarinePosition position tracker"""
-
-    _directional_update = {
-        "forward": add,
-        "down": add,
-        "up": sub,
-    }
-
-    def __init__(self, horizontal: int = 0, depth: int = 0, aim: int = 0):
-        self.horizontal = horizontal
-        self.depth = depth
-        self.aim = aim
-
-    def move(self, direction: str, units: int, aiming: bool = False):
-        """Move units amount into direction"""
-        update = self._directional_update[direction]
-        if direction == "forward":
-            self.horizontal = update(self.horizontal, units)
-            if aiming:
-                self.depth = update(self.depth, self.aim * units)
-        elif aiming:
-            self.aim = update(self.aim, units)
-        else:
-            self.depth = update(self.depth, units)
+    horizontal: int = 0
+    depth: int = 0
+    aim: int = 0
 
     @property
     def product(self):
@@ -74,16 +62,48 @@ class SubmarinePosition:
         return self.horizontal * self.depth
 
 
-if __name__ == "__main__":
+def parse_course(input_data: str) -> tuple[np.ndarray, np.ndarray]:
+    """Forward units and down units, negative for up, of every command"""
+    for code, direction in enumerate(DIRECTIONS):
+        input_data = input_data.replace(direction, str(code))
+    directions, units = np.fromstring(input_data, dtype=int, sep=" ").reshape(-1, 2).T
+    forward = np.where(directions == FORWARD, units, 0)
+    down = np.where(directions == DOWN, units, 0) - np.where(directions == UP, units, 0)
+    return forward, down
+
+
+def steer(input_data: str, aiming: bool) -> SubmarinePosition:
+    """
+    Follow all controls from the starting position at once
+
+    Without aiming down and up change the depth directly. With aiming they change the aim, which
+    is their cumulative sum, and every forward command goes aim times its units deeper.
+    """
+    forward, down = parse_course(input_data)
+    if not aiming:
+        return SubmarinePosition(horizontal=int(forward.sum()), depth=int(down.sum()))
+    aim = np.cumsum(down)
+    return SubmarinePosition(
+        horizontal=int(forward.sum()), depth=int(aim @ forward), aim=int(aim[-1])
+    )
+
 
-    with open("solutions/2021/day2/input.txt", "r") as f:
-        controls = f.read().splitlines()
-
-    position1 = SubmarinePosition()
-    position2 = SubmarinePosition()
-    for step in controls:
-        step_direction, step_units = step.split(" ")
-        position1.move(step_direction, int(step_units))
-        position2.move(step_direction, int(step_units), aiming=True)
-    print(f"Answer 1 should be: {position1.product}")
-    print(f"Answer 2 should be: {position2.product}")
+def part_1(input_data) -> int:
+    return steer(input_data, aiming=False).product
+
+
+def part_2(input_data) -> int:
+    return steer(input_data, aiming=True).product
+
+
+def main():
+    puzzle = Puzzle(day=2, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
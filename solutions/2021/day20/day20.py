@@ -134,23 +134,24 @@ to account for the infinite size of the images. How many pixels are lit in the r
 """
 from io import StringIO
 
-from scipy import ndimage
 import numpy as np
 
+from aoctools.inputs import Puzzle
+
 
 translation = str.maketrans({"#": "1,", ".": "0,"})
 kernel = 2 ** np.flip(np.arange(9).reshape((3, 3)))
 
-if __name__ == "__main__":
 
-    with open("solutions/2021/day20/input.txt", "r") as f:
-        enhancement_algorithm, image = f.read().translate(translation).split("\n\n")
+def enhance(input_data: str, steps: int) -> np.ndarray:
+    """Apply the image enhancement algorithm a number of times to the input image"""
+    from scipy import ndimage
 
+    enhancement_algorithm, image = input_data.translate(translation).split("\n\n")
     enhancement_mask = np.loadtxt(StringIO(enhancement_algorithm[:-1]), delimiter=",", dtype=int)
-    image_array = np.loadtxt(StringIO(image.replace(",\n", "\n")), delimiter=",", dtype=int)
+    image_array = np.loadtxt(StringIO(image.replace(",\n", "\n").rstrip(",\n")), delimiter=",", dtype=int)
     full_empty_mask = [enhancement_mask[-1], enhancement_mask[0]]
-    lit_at_2 = None
-    for i in range(50):
+    for i in range(steps):
         image_array = enhancement_mask[
             ndimage.correlate(
                 np.pad(image_array, 1, mode="constant", constant_values=full_empty_mask[i % 2]),
@@ -159,8 +160,25 @@ if __name__ == "__main__":
                 cval=full_empty_mask[i % 2],
             )
         ]
-        if i == 1:
-            lit_at_2 = np.sum(image_array)
+    return image_array
+
+
+def part_1(input_data) -> int:
+    return int(np.sum(enhance(input_data, steps=2)))
+
+
+def part_2(input_data) -> int:
+    return int(np.sum(enhance(input_data, steps=50)))
 
-    print(f"Answer 1: {lit_at_2}")
-    print(f"Answer 2: {np.sum(image_array)}")
+
+def main():
+    puzzle = Puzzle(day=20, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -76,10 +76,10 @@ more universes; in how many universes does that player win?
 
 """
 import re
-from itertools import islice, chain
-from copy import deepcopy
+from itertools import islice
 from typing import Iterator
-from collections import Counter
+
+from aoctools.inputs import Puzzle
 
 start_player_pattern = re.compile(r"Player (?P<player_id>\d) starting position: (?P<starting_position>\d{1,2})")
 
@@ -126,33 +126,11 @@ class DiracDice:
             self.rolls += rolls_per_turn
         self.is_finished = True
 
-    def multiverse_step(self, die: Iterator[int], max_score=21) -> list["DiracDice", ...]:
-        """Play a single round and return multiverse instances"""
-        outcomes = []
-        for roll in die:
-            game = self.copy()
-            player = game.get_current_player()
-            player.move(roll, spaces=self.spaces)
-            game.rolls += 1
-            if game.max_score >= max_score:
-                game.is_finished = True
-            outcomes.append(game)
-        return outcomes
-
     @property
     def max_score(self):
         """Maximum score"""
         return max(self.players, key=lambda p: p.score).score
 
-    def copy(self):
-        """Copy instance"""
-        return deepcopy(self)
-
-    def __hash__(self):
-        """Unique identifier for a game"""
-        player_stats = chain.from_iterable((player.position, player.score) for player in dd.players)
-        return hash((self.current_player_idx, ) + tuple(player_stats))
-
 
 def deterministic_100_sided_die():
     """returns roll number, increases next roll by 1 and wraps at 100 to 1"""
@@ -162,27 +140,20 @@ def deterministic_100_sided_die():
         roll = roll % 100 + 1
 
 
-if __name__ == "__main__":
-
-    with open("solutions/2021/day21/test_input.txt", "r") as f:
-        data = f.read()
-
-    players = [Player(int(m['player_id']), int(m["starting_position"])) for m in re.finditer(start_player_pattern, data)]
+def part_1(input_data) -> int:
+    players = [Player(int(m['player_id']), int(m["starting_position"])) for m in re.finditer(start_player_pattern, input_data)]
     dd = DiracDice(players, spaces=10)
-    dd_multi = dd.copy()
     dd.play(die=deterministic_100_sided_die())
+    return min(players, key=lambda p: p.score).score * dd.rolls
+
+
+def main():
+    puzzle = Puzzle(day=21, year=2021)
 
-    multiverse_counter = Counter(dd_multi.multiverse_step(die=[1, 2, 3], max_score=21))
-    move_score = 0
-    while not all(game.is_finished for game in multiverse_counter.keys()):
-        step_counter = Counter()
-        while multiverse_counter:
-            game, count = multiverse_counter.popitem()
-            if game.max_score != move_score or game.is_finished:
-                step_counter.update({game: count})
-            step_counter.update(dict.fromkeys(game.multiverse_step([1, 2, 3], max_score=21), count))
-        move_score += 1
-        multiverse_counter.update(step_counter)
-
-    print(f"Answer 1: {min(players, key=lambda p: p.score).score * dd.rolls}")
-    print(f"Answer 2: {''}")
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    print(f"{puzzle.answer_a=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -109,45 +109,71 @@ sure to represent your answer in decimal, not binary.)
 """
 from operator import ge, lt
 
+import numpy as np
 
-def find_gamma_epsilon(diagnostics_list: list[str]) -> tuple[int, int]:
-    """Find gamma epsilon from diagnostics"""
-    shape = (len(diagnostics_list), len(diagnostics_list[0]))
-    diagnostics_stream = ''.join(diagnostics_list)
-    gam, eps = 0, 0
-    for bit in range(shape[1]):
-        count_1 = diagnostics_stream[bit::shape[1]].count("1")
-        assert count_1 != shape[0] // 2  # none most common should be impossible
-        if count_1 > shape[0] // 2:
-            gam += 2**(shape[1] - bit - 1)
+from aoctools.grid import lookup_table, read_grid
+from aoctools.inputs import Puzzle
+
+BITS = lookup_table({"1": 1}, dtype=np.uint8)
+
+
+def bit_values(n_bits: int) -> np.ndarray:
+    """Value of every bit column, most significant first"""
+    return 1 << np.arange(n_bits - 1, -1, -1)
+
+
+def find_gamma_epsilon(bits: np.ndarray) -> tuple[int, int]:
+    """Find gamma epsilon from the most common bit of every column of the diagnostics bit matrix"""
+    n_numbers, n_bits = bits.shape
+    double_ones = 2 * bits.sum(axis=0, dtype=int)
+    if np.any(double_ones == n_numbers):
+        raise ValueError("every bit column should have a most common bit")
+    gamma = int((double_ones > n_numbers) @ bit_values(n_bits))
+    return gamma, (1 << n_bits) - 1 - gamma
+
+
+def find_gas_diagnostics(numbers: np.ndarray, n_bits: int, gas_type: str) -> int:
+    """
+    Find diagnostic for gas type from the sorted diagnostic numbers
+
+    The numbers left after every bit share their leading bits, so they are a contiguous range of
+    the sorted numbers in which the numbers with the next bit set start at a binary search.
+    """
+    keep_ones = {"o2": ge, "co2": lt}[gas_type]
+    start, stop, prefix = 0, len(numbers), 0
+    for bit in bit_values(n_bits).tolist():
+        if stop - start == 1:
+            break
+        split = start + int(np.searchsorted(numbers[start:stop], prefix | bit))
+        if split == start or (split < stop and keep_ones(2 * (stop - split), stop - start)):
+            start, prefix = split, prefix | bit
         else:
-            eps += 2**(shape[1] - bit - 1)
-    return gam, eps
+            stop = split
+    return int(numbers[start])
 
 
-def find_gas_diagnostics(diagnostics_list: list[str], gas_type: str) -> int:
-    """Find diagnostic for gas type"""
-    gas_comparison = {"o2": ge, "co2": lt}
-    diagnostics_gas = diagnostics_list.copy()
-    n_bits = len(diagnostics_gas[0])
-    bit = 0
-    while len(diagnostics_gas) > 1:
-        count_bit = ''.join(o2[bit] for o2 in diagnostics_gas).count("1")
-        keep = "1" if gas_comparison[gas_type](count_bit * 2, len(diagnostics_gas)) else "0"
-        diagnostics_gas = [o2 for o2 in diagnostics_gas if o2[bit] == keep]
-        bit = (bit + 1) % n_bits
-    gas_rating = int(diagnostics_gas[0], 2)
-    return gas_rating
+def part_1(input_data) -> int:
+    gamma, epsilon = find_gamma_epsilon(read_grid(input_data, BITS))
+    return gamma * epsilon
 
 
-if __name__ == "__main__":
+def part_2(input_data) -> int:
+    bits = read_grid(input_data, BITS)
+    n_bits = bits.shape[1]
+    numbers = np.sort(bits @ bit_values(n_bits))
+    o2_rating = find_gas_diagnostics(numbers, n_bits, gas_type="o2")
+    co2_rating = find_gas_diagnostics(numbers, n_bits, gas_type="co2")
+    return o2_rating * co2_rating
 
-    with open("solutions/2021/day3/input.txt", "r") as f:
-        diagnostics = f.read().split()
 
-    gamma, epsilon = find_gamma_epsilon(diagnostics)
-    o2_rating = find_gas_diagnostics(diagnostics, gas_type="o2")
-    co2_rating = find_gas_diagnostics(diagnostics, gas_type="co2")
+def main():
+    puzzle = Puzzle(day=3, year=2021)
 
-    print(f"Answer 1 should be: {gamma * epsilon}")
-    print(f"Answer 2 should be: {o2_rating * co2_rating}")
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -90,6 +90,8 @@ Figure out which board will win last. Once it wins, what would its final score b
 """
 import numpy as np
 
+from aoctools.inputs import Puzzle
+
 
 def determine_boards_with_bingo(marked: np.ndarray) -> np.ndarray:
     """Determine which of the boards have bingo"""
@@ -99,11 +101,11 @@ def determine_boards_with_bingo(marked: np.ndarray) -> np.ndarray:
     return column_bingo + row_bingo > 0
 
 
-if __name__ == "__main__":
-
-    user_input_file = "solutions/2021/day4/input.txt"
-    draws = np.genfromtxt(user_input_file, max_rows=1, delimiter=",", dtype=int)
-    boards = np.genfromtxt(user_input_file, skip_header=2, dtype=int).reshape((100, 5, 5))
+def play_bingo(input_data: str) -> tuple[int, int]:
+    """Play bingo on all boards and return the scores of the first and the last board to win"""
+    draws_txt, boards_txt = input_data.split("\n", 1)
+    draws = np.array(draws_txt.split(","), dtype=int)
+    boards = np.array(boards_txt.split(), dtype=int).reshape((-1, 5, 5))
     score1, score2 = 0, 0
     last_board_to_win = None
 
@@ -118,6 +120,27 @@ if __name__ == "__main__":
         elif np.sum(have_bingo) == len(boards):
             score2 = boards[last_board_to_win][~marked[last_board_to_win]].sum() * draw
             break
+    return int(score1), int(score2)
+
+
+def part_1(input_data) -> int:
+    score1, _ = play_bingo(input_data)
+    return score1
+
 
-    print(f"Answer 1 should be: {score1}")
-    print(f"Answer 2 should be: {score2}")
+def part_2(input_data) -> int:
+    _, score2 = play_bingo(input_data)
+    return score2
+
+
+def main():
+    puzzle = Puzzle(day=4, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
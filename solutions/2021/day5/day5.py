@@ -83,6 +83,8 @@ Consider all of the lines. At how many points do at least two lines overlap?
 """
 import numpy as np
 
+from aoctools.inputs import Puzzle
+
 
 class Line:
     """Line representation"""
@@ -114,10 +116,9 @@ class Line:
         return max(self.y1, self.y2)
 
 
-if __name__ == "__main__":
-
-    with open("solutions/2021/day5/input.txt", "r") as f:
-        lines = [Line.from_puzzle_input(line) for line in f.readlines()]
+def vent_fields(input_data: str) -> tuple[np.ndarray, np.ndarray]:
+    """Count the straight and the diagonal vent lines covering every point"""
+    lines = [Line.from_puzzle_input(line) for line in input_data.splitlines()]
 
     straight_field = np.zeros((1000, 1000), dtype=int)
     diagonal_field = straight_field.copy()
@@ -129,7 +130,28 @@ if __name__ == "__main__":
             is_identity = (line.x2 - line.x1 > 0) == (line.y2 - line.y1 > 0)
             diag_slice = slice(None, None, None if is_identity else -1)
             diagonal_field[field_index] += np.diag(np.ones((line.xmax - line.xmin + 1), dtype=int))[diag_slice]
+    return straight_field, diagonal_field
+
+
+def part_1(input_data) -> int:
+    straight_field, _ = vent_fields(input_data)
+    return int(np.sum(straight_field > 1))
+
 
+def part_2(input_data) -> int:
+    straight_field, diagonal_field = vent_fields(input_data)
     field = straight_field + diagonal_field
-    print(f"Answer 1: {np.sum(straight_field > 1)}")
-    print(f"Answer 2: {np.sum(field > 1)}")
+    return int(np.sum(field > 1))
+
+
+def main():
+    puzzle = Puzzle(day=5, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
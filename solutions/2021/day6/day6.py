@@ -72,17 +72,35 @@ Find a way to simulate lanternfish. How many lanternfish would there be after 80
 """
 from collections import Counter
 
+from aoctools.inputs import Puzzle
 
-with open("solutions/2021/day6/input.txt", "r") as f:
-    fish_timer_counts = Counter(map(int, f.read().split(",")))
 
-fish_timer_counts1 = {}
-for i, r in enumerate(range(256), start=1):
-    fish_timer_counts = {key-1: value for key, value in fish_timer_counts.items()}
-    fish_timer_counts[8] = fish_timer_counts.pop(-1, 0)
-    fish_timer_counts[6] = fish_timer_counts.get(8, 0) + fish_timer_counts.get(6, 0)
-    if i == 80:
-        fish_timer_counts1 = fish_timer_counts.copy()
+def count_fish(input_data: str, days: int) -> int:
+    """Count the lanternfish after the given number of days"""
+    fish_timer_counts = Counter(map(int, input_data.split(",")))
+    for _ in range(days):
+        fish_timer_counts = {key-1: value for key, value in fish_timer_counts.items()}
+        fish_timer_counts[8] = fish_timer_counts.pop(-1, 0)
+        fish_timer_counts[6] = fish_timer_counts.get(8, 0) + fish_timer_counts.get(6, 0)
+    return sum(fish_timer_counts.values())
 
-print(f"Answer 1: {sum(fish_timer_counts1.values())}")
-print(f"Answer 2: {sum(fish_timer_counts.values())}")
+
+def part_1(input_data) -> int:
+    return count_fish(input_data, days=80)
+
+
+def part_2(input_data) -> int:
+    return count_fish(input_data, days=256)
+
+
+def main():
+    puzzle = Puzzle(day=6, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
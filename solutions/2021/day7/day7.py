@@ -77,7 +77,8 @@ can make you an escape route! How much fuel must they spend to align to that pos
 """
 
 import numpy as np
-from scipy.optimize import fmin
+
+from aoctools.inputs import Puzzle
 
 FUEL_COST_LOOKUP = np.cumsum(np.arange(2000))
 
@@ -110,31 +111,39 @@ def total_fuel_used(
     return np.sum(fuel_costs).item()
 
 
-if __name__ == "__main__":
-
-    with open("solutions/2021/day7/input.txt", "r") as f:
-        crab_positions = np.array([*map(int, f.read().split(","))])
+def optimal_fuel_used(crab_positions: np.ndarray, crab_engineering: bool) -> int:
+    """Find the alignment position that uses the least fuel and return the fuel used"""
+    from scipy.optimize import fmin
 
-    (optimal_position_1,) = fmin(
+    start = np.mean(crab_positions) if crab_engineering else np.median(crab_positions)
+    (optimal_position,) = fmin(
         total_fuel_used,
-        np.median(crab_positions),
-        args=(crab_positions, False),
+        start,
+        args=(crab_positions, crab_engineering),
         xtol=1e-1,
+        disp=False,
     )
+    return total_fuel_used(optimal_position, crab_positions, crab_engineering=crab_engineering)
 
-    (optimal_position_2,) = fmin(
-        total_fuel_used,
-        np.mean(crab_positions),
-        args=(crab_positions, True),
-        xtol=1e-1,
-    )
 
-    fuel_used_alignment_1 = total_fuel_used(
-        optimal_position_1, crab_positions, crab_engineering=False
-    )
-    fuel_used_alignment_2 = total_fuel_used(
-        optimal_position_2, crab_positions, crab_engineering=True
-    )
+def part_1(input_data) -> int:
+    crab_positions = np.array([*map(int, input_data.split(","))])
+    return optimal_fuel_used(crab_positions, crab_engineering=False)
 
-    print(f"Answer 1: {fuel_used_alignment_1}")
-    print(f"Answer 2: {fuel_used_alignment_2}")
+
+def part_2(input_data) -> int:
+    crab_positions = np.array([*map(int, input_data.split(","))])
+    return optimal_fuel_used(crab_positions, crab_engineering=True)
+
+
+def main():
+    puzzle = Puzzle(day=7, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -162,6 +162,8 @@ values. What do you get if you add up all of the output values?
 """
 from collections import Counter
 
+from aoctools.inputs import Puzzle
+
 
 def decode_segment_data(segment: str) -> str:
     """Sort segment sections and split input and output"""
@@ -210,14 +212,25 @@ def decypher_input_segment(input_segment: str) -> dict[str, str]:
     return decypher_dict
 
 
-if __name__ == "__main__":
+def part_1(input_data) -> int:
+    counter = Counter()
+    for segment in input_data.splitlines():
+        counter.update(decode_segment_data(segment))
+    return counter['1'] + counter['4'] + counter['7'] + counter['8']
 
-    with open("solutions/2021/day8/input.txt", "r") as f:
-        segment_numbers = [decode_segment_data(segment) for segment in f.read().splitlines()]
 
-    counter = Counter()
-    for number in segment_numbers:
-        counter.update(number)
+def part_2(input_data) -> int:
+    return sum(int(decode_segment_data(segment)) for segment in input_data.splitlines())
+
 
-    print(f"Answer 1: {counter['1'] + counter['4'] + counter['7'] + counter['8']}")
-    print(f"Answer 2: {sum(map(int, segment_numbers))}")
+def main():
+    puzzle = Puzzle(day=8, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
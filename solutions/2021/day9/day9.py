@@ -84,19 +84,45 @@ Find the three largest basins and multiply their sizes together. In the above ex
 What do you get if you multiply together the sizes of the three largest basins?
 
 """
-from scipy import ndimage
 import numpy as np
 
-with open("solutions/2021/day9/input.txt", "r") as f:
-    dem = np.array([[*map(int, line)] for line in f.read().splitlines()])
+from aoctools.grid import DIGITS, read_grid
+from aoctools.inputs import Puzzle
 
 adjacent = np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]])
-lowest_neighbor = ndimage.rank_filter(dem, 1, footprint=adjacent, mode="constant", cval=9.0)
-low_points_mask = dem < lowest_neighbor
 
-basins_mask = ndimage.binary_dilation(low_points_mask, structure=adjacent, iterations=-1, mask=dem != 9)
-basins, n_basins = ndimage.label(basins_mask, structure=adjacent)
-basin_nrs, basin_sizes = np.unique(basins[basins>0], return_counts=True)
 
-print(f"Answer 1: {np.sum(dem[low_points_mask] + 1)}")
-print(f"Answer 2: {np.product(basin_sizes[np.argsort(basin_sizes)[-3:]])}")
+def find_low_points(dem: np.ndarray) -> np.ndarray:
+    """Mask of the points that are lower than all of their neighbors"""
+    from scipy import ndimage
+
+    lowest_neighbor = ndimage.rank_filter(dem, 1, footprint=adjacent, mode="constant", cval=9.0)
+    return dem < lowest_neighbor
+
+
+def part_1(input_data) -> int:
+    dem = read_grid(input_data, DIGITS)
+    return int(np.sum(dem[find_low_points(dem)] + 1))
+
+
+def part_2(input_data) -> int:
+    from scipy import ndimage
+
+    dem = read_grid(input_data, DIGITS)
+    basins_mask = ndimage.binary_dilation(find_low_points(dem), structure=adjacent, iterations=-1, mask=dem != 9)
+    basins, n_basins = ndimage.label(basins_mask, structure=adjacent)
+    basin_nrs, basin_sizes = np.unique(basins[basins>0], return_counts=True)
+    return int(np.prod(basin_sizes[np.argsort(basin_sizes)[-3:]]))
+
+
+def main():
+    puzzle = Puzzle(day=9, year=2021)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
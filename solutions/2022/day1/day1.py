@@ -72,17 +72,32 @@ Find the top three Elves carrying the most Calories. How many Calories are those
 total?
 
 """
+from aoctools.inputs import Puzzle
+
+
+def total_calories_per_elf(input_data: str) -> list[int]:
+    """Total calories carried per elf, sorted from most to least"""
+    calories = [list(map(int, elf_calories.split("\n")))
+                for elf_calories in input_data.rstrip('\n').split("\n\n")]
+    return sorted((sum(elf_calories) for elf_calories in calories), reverse=True)
+
+
+def part_1(input_data) -> int:
+    return total_calories_per_elf(input_data)[0]
 
-if __name__ == "__main__":
 
-    with open("solutions/2022/day1/input.txt", "r") as f:
-        calories = [list(map(int, elf_calories.split("\n")))
-                    for elf_calories in f.read().rstrip('\n').split("\n\n")]
+def part_2(input_data) -> int:
+    return sum(total_calories_per_elf(input_data)[:3])
 
-    total_calories_per_elf = [sum(elf_calories) for elf_calories in calories]
-    total_calories_per_elf.sort(reverse=True)
-    max_calories = total_calories_per_elf[0]
-    top3_calories_sum = sum(total_calories_per_elf[:3])
 
-    print(f"Solution 1: {max_calories=}")
-    print(f"Solution 2: {top3_calories_sum=}")
+def main():
+    puzzle = Puzzle(day=1, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
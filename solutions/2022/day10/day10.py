@@ -4,6 +4,8 @@ https://adventofcode.com/2022/day/10
 from dataclasses import dataclass, field
 from functools import partial
 
+from aoctools.inputs import Puzzle
+
 
 @dataclass
 class CRT:
@@ -63,13 +65,28 @@ class ClockCircuit:
                     yield self.signal_strength
 
 
-if __name__ == "__main__":
+def part_1(input_data) -> int:
+    instructions = input_data.rstrip("\n").split("\n")
+    cc = ClockCircuit()
+    return sum(ss for ss in cc.run(instructions, yield_for=range(20, 221, 40)))
 
-    with open("solutions/2022/day10/input.txt", "r") as f:
-        instructions = [instruction for instruction in f.read().rstrip("\n").split("\n")]
 
+def part_2(input_data) -> str:
+    instructions = input_data.rstrip("\n").split("\n")
     cc = ClockCircuit()
-    signal_strengths = [ss for ss in cc.run(instructions, yield_for=range(20, 221, 40))]
+    for _ in cc.run(instructions, yield_for=range(0)):
+        pass
+    return str(cc.crt)
+
 
-    print(f"Solution 1: {sum(signal_strengths)}")
-    print(f"Solution 2: \n{cc.crt}")
+def main():
+    puzzle = Puzzle(day=10, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}\n{puzzle.answer_b}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ import re
 from typing import Callable
 from math import lcm
 
+from aoctools.inputs import Puzzle
+
 
 class Monkey:
     def __init__(
@@ -75,26 +77,38 @@ class MonkeyGame:
                 self.monkeys[pass_to_monkey_nr].receive_item(new_worry_level)
 
 
-if __name__ == "__main__":
-    with open("solutions/2022/day11/test-input.txt", "r") as f:
-        monkey_setup_list = [m for m in f.read().rstrip("\n").split("\n\n")]
-
+def monkey_business(input_data: str, rounds: int, relief: bool) -> int:
+    """Product of the inspection counts of the two most active monkeys"""
+    monkey_setup_list = [m for m in input_data.rstrip("\n").split("\n\n")]
     mg = MonkeyGame([Monkey.from_monkey_setup(setup) for setup in monkey_setup_list])
-    mg.play(rounds=20)
-    monkey_business_1 = sorted(
+    if not relief:
+        limit = lcm(*[monkey.divider for monkey in mg.monkeys.values()])
+        for monkey in mg.monkeys.values():
+            monkey.set_worry_limit(limit)
+    mg.play(rounds=rounds)
+    inspection_counts = sorted(
         [monkey.inspection_counter for monkey_nr, monkey in mg.monkeys.items()],
         reverse=True
     )
+    return inspection_counts[0] * inspection_counts[1]
 
-    mg = MonkeyGame([Monkey.from_monkey_setup(setup) for setup in monkey_setup_list])
-    limit = lcm(*[monkey.divider for monkey in mg.monkeys.values()])
-    for monkey in mg.monkeys.values():
-        monkey.set_worry_limit(limit)
-    mg.play(rounds=10000)
-    monkey_business_2 = sorted(
-        [monkey.inspection_counter for monkey_nr, monkey in mg.monkeys.items()],
-        reverse=True
-    )
 
-    print(f"Solution 1: {monkey_business_1[0] * monkey_business_1[1]}")
-    print(f"Solution 2: {monkey_business_2[0] * monkey_business_2[1]}")
+def part_1(input_data) -> int:
+    return monkey_business(input_data, rounds=20, relief=True)
+
+
+def part_2(input_data) -> int:
+    return monkey_business(input_data, rounds=10000, relief=False)
+
+
+def main():
+    puzzle = Puzzle(day=11, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
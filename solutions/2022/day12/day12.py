@@ -5,6 +5,9 @@ from typing import Optional
 
 import numpy as np
 
+from aoctools.grid import read_grid
+from aoctools.inputs import Puzzle
+
 
 class PathFinder:
     def __init__(self, dem: np.ndarray, start_elevation: int, maximum_step_up: Optional[int]):
@@ -55,19 +58,36 @@ class PathFinder:
         return self.step_arr[position_ij]
 
 
-if __name__ == "__main__":
-    with open("solutions/2022/day12/input.txt", "r") as f:
-        dem = np.array([list(map(ord, line)) for line in f.read().rstrip("\n").split("\n")])
+def minimum_steps_to_end(input_data: str, start_elevation: str) -> int:
+    """Minimum number of steps from any position at the start elevation to the end position"""
+    dem = read_grid(input_data).astype(int)
 
     end_ij = tuple(map(np.ndarray.item, np.where(dem == ord("E"))))
     dem[dem == ord("S")] = ord("a") - 1
     dem[dem == ord("E")] = ord("z") + 1
 
-    pf_s = PathFinder(dem, start_elevation=ord("a") - 1, maximum_step_up=1)
-    pf_s.find_minimum_steps_to_positions()
+    elevation = ord("a") - 1 if start_elevation == "S" else ord(start_elevation)
+    pf = PathFinder(dem, start_elevation=elevation, maximum_step_up=1)
+    pf.find_minimum_steps_to_positions()
+    return pf.report_minimum_steps_for_position(end_ij).item()
+
+
+def part_1(input_data) -> int:
+    return minimum_steps_to_end(input_data, start_elevation="S")
+
 
-    pf_a = PathFinder(dem, start_elevation=ord("a"), maximum_step_up=1)
-    pf_a.find_minimum_steps_to_positions()
+def part_2(input_data) -> int:
+    return minimum_steps_to_end(input_data, start_elevation="a")
 
-    print(f"Solution 1: {pf_s.report_minimum_steps_for_position(end_ij)}")
-    print(f"Solution 2: {pf_a.report_minimum_steps_for_position(end_ij)}")
+
+def main():
+    puzzle = Puzzle(day=12, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,12 @@ from dataclasses import dataclass
 from itertools import zip_longest, chain
 from typing import Union, Optional
 
-PacketStructure = Union[int, list['PacketStructure'], None]
+from aoctools.inputs import Puzzle
 
-SEP = ">> "
+PacketStructure = Union[int, list['PacketStructure'], None]
 
 
-def packet_pair_isordered(left: PacketStructure, right: PacketStructure, depth=0) -> Optional[bool]:
-    print(f"{SEP*depth} Comparing packets {left} and {right}")
+def packet_pair_isordered(left: PacketStructure, right: PacketStructure) -> Optional[bool]:
     match left, right:
         case int(), int():
             if left < right:
@@ -22,15 +21,15 @@ def packet_pair_isordered(left: PacketStructure, right: PacketStructure, depth=0
             return None
         case list(), list():  # both lists
             for left_sub, right_sub in zip_longest(left, right):
-                result = packet_pair_isordered(left_sub, right_sub, depth=depth+1)
+                result = packet_pair_isordered(left_sub, right_sub)
                 if result is not None:
                     return result
         case list(), int():
-            result = packet_pair_isordered(left, [right], depth=depth+1)
+            result = packet_pair_isordered(left, [right])
             if result is not None:
                 return result
         case int(), list():
-            result = packet_pair_isordered([left], right, depth=depth+1)
+            result = packet_pair_isordered([left], right)
             if result is not None:
                 return result
         case None, _:
@@ -60,18 +59,23 @@ class Packet:
         return packet_pair_isordered(self.structure, other.structure) is False
 
 
-if __name__ == "__main__":
-    with open("solutions/2022/day13/input.txt", "r") as f:
-        packet_pairs: list[tuple[Packet, ...]] = [
-            tuple(map(Packet.from_string, line.split("\n")))
-            for line in f.read().rstrip("\n").split("\n\n")
-        ]
+def read_packet_pairs(input_data: str) -> list[tuple[Packet, ...]]:
+    return [
+        tuple(map(Packet.from_string, line.split("\n")))
+        for line in input_data.rstrip("\n").split("\n\n")
+    ]
 
+
+def part_1(input_data) -> int:
     indices_sum = 0
-    for i, (left_packet, right_packet) in enumerate(packet_pairs, start=1):
+    for i, (left_packet, right_packet) in enumerate(read_packet_pairs(input_data), start=1):
         if left_packet < right_packet:
             indices_sum += i
+    return indices_sum
+
 
+def part_2(input_data) -> int:
+    packet_pairs = read_packet_pairs(input_data)
     div_1 = Packet([[2]])
     div_2 = Packet([[6]])
     packet_pairs.append((div_1, div_2))
@@ -79,6 +83,17 @@ if __name__ == "__main__":
     all_packets_sorted = sorted(chain(*packet_pairs))
     div_1_index = all_packets_sorted.index(div_1) + 1
     div_2_index = all_packets_sorted.index(div_2) + 1
+    return div_1_index * div_2_index
 
-    print(f"Solution 1: {indices_sum}")
-    print(f"Solution 2: {div_1_index * div_2_index}")
+
+def main():
+    puzzle = Puzzle(day=13, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
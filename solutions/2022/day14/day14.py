@@ -6,6 +6,8 @@ from typing import Optional
 
 import numpy as np
 
+from aoctools.inputs import Puzzle
+
 Coordinate = namedtuple("Coordinate", ["x", "y"])
 
 
@@ -38,14 +40,15 @@ def drop_sand(cave_arr: np.ndarray, column_candidate: int, row_candidate: Option
         drop_sand(cave_arr, column_candidate + 1, row_candidate + 1)
 
 
-if __name__ == "__main__":
-
-    with open("solutions/2022/day14/input.txt", "r") as f:
-        coordinate_sequence_list = []
-        for line in f.read().rstrip("\n").split("\n"):
-            coordinate_sequence_list.append(
-                [Coordinate(*map(int, coord.split(","))) for coord in line.split(" -> ")]
-            )
+def read_caves(input_data: str) -> tuple[np.ndarray, np.ndarray, int, int]:
+    """
+    Read the cave without and with floor and the column of the sand discharge in each of them
+    """
+    coordinate_sequence_list = []
+    for line in input_data.rstrip("\n").split("\n"):
+        coordinate_sequence_list.append(
+            [Coordinate(*map(int, coord.split(","))) for coord in line.split(" -> ")]
+        )
 
     min_y = 0
     max_y = max(max(coord_seq, key=lambda c: c.y).y for coord_seq in coordinate_sequence_list)
@@ -69,24 +72,41 @@ if __name__ == "__main__":
     cave2 = np.pad(cave1, ((add_top, add_bottom), (add_left, add_right)))
     cave2[-1, :] = 2
 
+    # plt.imshow(cave1, extent=(min_x, max_x, cave1.shape[0], 0 ))
+    # plt.imshow(cave2, extent=(min_x - add_left, max_x + add_right, cave2.shape[0], 0 ))
+    return cave1, cave2, sand_discharge_loc.x - min_x, sand_discharge_loc.x - min_x + add_left
+
+
+def part_1(input_data) -> int:
+    cave1, _, discharge_column1, _ = read_caves(input_data)
     sand_units1 = 0
     while True:
         try:
-            drop_sand(cave1, sand_discharge_loc.x - min_x)
+            drop_sand(cave1, discharge_column1)
             sand_units1 += 1
         except AbyssEncontered:
-            break
+            return sand_units1
 
+
+def part_2(input_data) -> int:
+    _, cave2, _, discharge_column2 = read_caves(input_data)
     sand_units2 = 0
     while True:
         try:
-            drop_sand(cave2, sand_discharge_loc.x - min_x + add_left)
+            drop_sand(cave2, discharge_column2)
             sand_units2 += 1
         except DepositionBlocked:
-            break
+            return sand_units2
 
-    print(f"Solution 1: {sand_units1}")
-    print(f"Solution 2: {sand_units2}")
 
-    # plt.imshow(cave1, extent=(min_x, max_x, cave1.shape[0], 0 ))
-    # plt.imshow(cave2, extent=(min_x - add_left, max_x + add_right, cave2.shape[0], 0 ))
+def main():
+    puzzle = Puzzle(day=14, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ from typing import Iterator, Optional
 import numpy as np
 import re
 
+from aoctools.inputs import Puzzle
+
 
 @dataclass
 class BeaconSensor:
@@ -67,23 +69,26 @@ loc_matcher = re.compile(
 )
 
 
-if __name__ == "__main__":
+def read_beacon_sensors(input_data: str) -> list[BeaconSensor]:
+    return [
+        BeaconSensor(*map(int, loc_matcher.match(line).groups()))
+        for line in input_data.rstrip("\n").split("\n")
+    ]
 
-    with open("solutions/2022/day15/input.txt", "r") as f:
-        beacon_sensors = [
-            BeaconSensor(*map(int, loc_matcher.match(line).groups()))
-            for line in f.read().rstrip("\n").split("\n")
-        ]
 
+def part_1(input_data) -> int:
+    beacon_sensors = read_beacon_sensors(input_data)
     y = 2_000_000
-    tuning_x_multiplier = 4_000_000
-    xy_bounds = range(0, 4_000_000 + 1)
-
     impossible_x_positions_at_y = set.union(
         *[set(x_range) for x_range in x_ranges_for_y(beacon_sensors, y)]
     ).difference([sb.bx for sb in beacon_sensors if sb.by == y])
+    return len(impossible_x_positions_at_y)
+
+
+def part_2(input_data) -> int:
+    beacon_sensors = read_beacon_sensors(input_data)
+    xy_bounds = range(0, 4_000_000 + 1)
 
-    tuning_frequency = None
     y = 4_000_000 - 1
     while True:
 
@@ -91,11 +96,19 @@ if __name__ == "__main__":
         if len(compresed_xranges) == 1 and compresed_xranges[0][0] < xy_bounds.start and compresed_xranges[0][1] > (xy_bounds.stop - 1):
             pass
         else:
-            print("Non consecutive bounds encountered")
             x_gap = compresed_xranges[0][1]
-            tuning_frequency = y + x_gap * 4_000_000
-            break
+            return y + x_gap * 4_000_000
         y -= stepsize
 
-    print(f"Solution 1: {len(impossible_x_positions_at_y)}")
-    print(f"Solution 2: {tuning_frequency}")
+
+def main():
+    puzzle = Puzzle(day=15, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
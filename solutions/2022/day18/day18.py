@@ -1,34 +1,47 @@
 """
 https://adventofcode.com/2022/day/18
 """
+from io import StringIO
+
 import numpy as np
-from scipy.signal import convolve
-from scipy.ndimage import binary_fill_holes
 
+from aoctools.inputs import Puzzle
 
-if __name__ == "__main__":
 
-    x, y, z = np.loadtxt("solutions/2022/day18/input.txt", dtype=int, delimiter=",").T
+def count_sides(a: np.ndarray) -> int:
+    """Count the exposed sides, the non-zero steps of a zero padded diff along each axis"""
+    return sum(
+        np.abs(np.diff(a, axis=axis, prepend=0, append=0)).sum().item() for axis in range(a.ndim)
+    )
+
 
+def read_droplet(input_data: str) -> np.ndarray:
+    """3D array with a 1 for every cube of lava"""
+    x, y, z = np.loadtxt(StringIO(input_data), dtype=int, delimiter=",").T
     a = np.zeros((z.max() + 1, y.max() + 1, x.max() + 1), dtype=int)
     a[z, y, x] = 1
+    return a
 
-    k1 = np.array([[[1, -1]]])
-    k2 = np.array([[[1], [-1]]])
-    k3 = np.array([[[1]], [[-1]]])
 
-    sides1 = (
-        np.abs(convolve(a, k1, "full")).sum()
-        + np.abs(convolve(a, k2, "full")).sum()
-        + np.abs(convolve(a, k3, "full")).sum()
-    )
+def part_1(input_data) -> int:
+    return count_sides(read_droplet(input_data))
 
-    b = binary_fill_holes(a, structure=None).astype(int)
-    sides2 = (
-            np.abs(convolve(b, k1, "full")).sum()
-            + np.abs(convolve(b, k2, "full")).sum()
-            + np.abs(convolve(b, k3, "full")).sum()
-    )
 
-    print(f"Solution 1: {sides1}")
-    print(f"Solution 2: {sides2}")
+def part_2(input_data) -> int:
+    from scipy.ndimage import binary_fill_holes
+
+    b = binary_fill_holes(read_droplet(input_data), structure=None).astype(int)
+    return count_sides(b)
+
+
+def main():
+    puzzle = Puzzle(day=18, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -70,6 +70,8 @@ everything goes exactly according to your strategy guide?
 import numpy as np
 from numpy.typing import NDArray
 
+from aoctools.inputs import Puzzle
+
 
 def calc_score(rpc_1: NDArray[np.int_], rpc_2: NDArray[np.int_]) -> NDArray[np.int_]:
     """
@@ -91,17 +93,25 @@ def calc_score(rpc_1: NDArray[np.int_], rpc_2: NDArray[np.int_]) -> NDArray[np.i
     return scores
 
 
-if __name__ == "__main__":
-
+def read_games(input_data: str) -> tuple[NDArray[np.int_], NDArray[np.int_]]:
+    """Read the rock paper scissors choices of the opponent and the second column of the guide"""
     trans_table = str.maketrans({"A": "1", "B": "2", "C": "3", "X": "1", "Y": "2", "Z": "3"})
-    with open("solutions/2022/day2/input.txt", "r") as f:
-        rpc_games = [
-            list(map(int, rpc_game.split(" ")))
-            for rpc_game in f.read().translate(trans_table).split("\n")
-            if rpc_game != ""
-        ]
+    rpc_games = [
+        list(map(int, rpc_game.split(" ")))
+        for rpc_game in input_data.translate(trans_table).split("\n")
+        if rpc_game != ""
+    ]
+    rpc_p1, rpc_p2 = np.array(rpc_games).T
+    return rpc_p1, rpc_p2
+
+
+def part_1(input_data) -> int:
+    rpc_p1, rpc_p21 = read_games(input_data)
+    return calc_score(rpc_p1, rpc_p21).sum().item()
 
-    rpc_p1, rpc_p21 = np.array(rpc_games).T
+
+def part_2(input_data) -> int:
+    rpc_p1, rpc_p21 = read_games(input_data)
 
     rpc_p22 = np.zeros_like(rpc_p21)  # second game rpc choices
     lose_games = rpc_p21 == 1
@@ -110,9 +120,17 @@ if __name__ == "__main__":
     rpc_p22[lose_games] = (rpc_p1[lose_games] - 2) % 3 + 1
     rpc_p22[draw_games] = rpc_p1[draw_games]
     rpc_p22[win_games] = rpc_p1[win_games] % 3 + 1
+    return calc_score(rpc_p1, rpc_p22).sum().item()
+
+
+def main():
+    puzzle = Puzzle(day=2, year=2022)
 
-    scores_1 = calc_score(rpc_p1, rpc_p21)
-    scores_2 = calc_score(rpc_p1, rpc_p22)
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
 
-    print(f"Solution 1: {scores_1.sum()}")
-    print(f"Solution 2: {scores_2.sum()}")
+
+if __name__ == "__main__":
+    main()
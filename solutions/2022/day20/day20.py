@@ -3,6 +3,8 @@ https://adventofcode.com/2022/day/20
 """
 from dataclasses import dataclass
 
+from aoctools.inputs import Puzzle
+
 
 @dataclass
 class CoordinateSequence:
@@ -21,26 +23,33 @@ class CoordinateSequence:
         return decrypted_sequence
 
 
-if __name__ == "__main__":
+def grove_coordinates_sum(decrypted_sequence: list[int]) -> int:
+    """Sum of the numbers 1000, 2000 and 3000 positions after the 0"""
+    zero_index = decrypted_sequence.index(0)
+    return sum(
+        decrypted_sequence[(zero_index + i) % len(decrypted_sequence)]
+        for i in [1000, 2000, 3000]
+    )
 
-    with open("solutions/2022/day20/input.txt", "r") as f:
-        sequence = list(map(int, f.read().rstrip("\n").split("\n")))
 
-    cs = CoordinateSequence(sequence)
-    decrypted_sequence_1 = cs.decrypt()
-    decrypted_sequence_2 = cs.decrypt(multiply=811589153, iterations=10)
+def part_1(input_data) -> int:
+    cs = CoordinateSequence(list(map(int, input_data.rstrip("\n").split("\n"))))
+    return grove_coordinates_sum(cs.decrypt())
 
-    zero_index_1 = decrypted_sequence_1.index(0)
-    coordinate_sum_1 = sum(
-        decrypted_sequence_1[(zero_index_1 + i) % len(decrypted_sequence_1)]
-        for i in [1000, 2000, 3000]
-    )
 
-    zero_index_2 = decrypted_sequence_2.index(0)
-    coordinate_sum_2 = sum(
-        decrypted_sequence_2[(zero_index_2 + i) % len(decrypted_sequence_2)]
-        for i in [1000, 2000, 3000]
-    )
+def part_2(input_data) -> int:
+    cs = CoordinateSequence(list(map(int, input_data.rstrip("\n").split("\n"))))
+    return grove_coordinates_sum(cs.decrypt(multiply=811589153, iterations=10))
+
+
+def main():
+    puzzle = Puzzle(day=20, year=2022)
 
-    print(f"Solution 1: {coordinate_sum_1}")
-    print(f"Solution 2: {coordinate_sum_2}")
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -91,23 +91,35 @@ Find the item type that corresponds to the badges of each three-Elf group. What
 priorities of those item types?
 
 """
+from aoctools.inputs import Puzzle
 
 
 def priority_score(c: str):
     return ord(c) - 38 if c.isupper() else ord(c) - 96
 
 
-if __name__ == "__main__":
-
-    with open("solutions/2022/day3/input.txt", "r") as f:
-        backpacks = [bp for bp in f.read().split("\n") if bp]
-
+def part_1(input_data) -> int:
+    backpacks = [bp for bp in input_data.split("\n") if bp]
     items = [set(bp[:len(bp)//2]).intersection(bp[len(bp)//2:]).pop()
              for bp in backpacks]
+    return sum(priority_score(item) for item in items)
+
+
+def part_2(input_data) -> int:
+    backpacks = [bp for bp in input_data.split("\n") if bp]
     badges = [set(backpacks[i]).intersection(backpacks[i+1]).intersection(backpacks[i+2]).pop()
               for i in range(0, len(backpacks), 3)]
-    item_priorities = [priority_score(item) for item in items]
-    badge_priorities = [priority_score(badge) for badge in badges]
+    return sum(priority_score(badge) for badge in badges)
 
-    print(f"Solution 1: {sum(item_priorities)}")
-    print(f"Solution 2: {sum(badge_priorities)}")
+
+def main():
+    puzzle = Puzzle(day=3, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -73,6 +73,7 @@ So, in this example, the number of overlapping assignment pairs is 4.
 In how many assignment pairs do the ranges overlap?
 
 """
+from aoctools.inputs import Puzzle
 
 
 def range_is_contained_in_range(r1: range, r2: range):
@@ -91,28 +92,40 @@ def ranges_overlap(r1: range, r2: range):
     return overlap
 
 
-if __name__ == "__main__":
-
-    with open("solutions/2022/day4/input.txt", "r") as f:
-        assignment_pairs = [ap for ap in f.read().split("\n") if ap]
-
+def read_assignment_ranges(input_data: str) -> list[tuple[range, range]]:
     assignment_ranges_list = []
-    for assignment_pair in assignment_pairs:
+    for assignment_pair in (ap for ap in input_data.split("\n") if ap):
         a1, a2 = assignment_pair.split(",")
         assignment_ranges_list.append((
             range(*map(int, a1.split('-'))),
             range(*map(int, a2.split('-'))),
         ))
+    return assignment_ranges_list
 
-    contained_ranges = sum(
+
+def part_1(input_data) -> int:
+    return sum(
         range_is_contained_in_range(*assignment_ranges)
         or range_is_contained_in_range(*reversed(assignment_ranges))
-        for assignment_ranges in assignment_ranges_list
+        for assignment_ranges in read_assignment_ranges(input_data)
     )
-    overlapping_ranges = sum(
+
+
+def part_2(input_data) -> int:
+    return sum(
         ranges_overlap(*assignment_ranges)
-        for assignment_ranges in assignment_ranges_list
+        for assignment_ranges in read_assignment_ranges(input_data)
     )
 
-    print(f"Solution 1: {contained_ranges}")
-    print(f"Solution 2: {overlapping_ranges}")
+
+def main():
+    puzzle = Puzzle(day=4, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -131,7 +131,8 @@ what crate ends up on top of each stack?
 
 """
 import re
-from copy import deepcopy
+
+from aoctools.inputs import Puzzle
 
 STACKS_TYPE = dict[int, list[str]]
 
@@ -160,15 +161,30 @@ def update_stacks(stacks: STACKS_TYPE, rearrangement_procedure_txt: str, multi_c
         stacks[int(move_match["to"])].extend(crates_to_move)
 
 
-if __name__ == "__main__":
+def rearrange(input_data: str, multi_crates: bool) -> str:
+    """Rearrange the stacks and return the crates on top of each stack"""
+    stacks_input, rearrangement_procedure_input = input_data.split("\n\n")
+    stacks_dict = read_stacks(stacks_input)
+    update_stacks(stacks_dict, rearrangement_procedure_input, multi_crates=multi_crates)
+    return ''.join(stacks_dict[stack][-1] for stack in stacks_dict)
+
+
+def part_1(input_data) -> str:
+    return rearrange(input_data, multi_crates=False)
+
 
-    with open("solutions/2022/day5/input.txt", "r") as f:
-        stacks_input, rearrangement_procedure_input = f.read().split("\n\n")
+def part_2(input_data) -> str:
+    return rearrange(input_data, multi_crates=True)
 
-    stacks_dict_1 = read_stacks(stacks_input)
-    stacks_dict_2 = deepcopy(stacks_dict_1)
-    update_stacks(stacks_dict_1, rearrangement_procedure_input, multi_crates=False)
-    update_stacks(stacks_dict_2, rearrangement_procedure_input, multi_crates=True)
 
-    print(f"Solution 1: {''.join(stacks_dict_1[stack][-1] for stack in stacks_dict_1)}")
-    print(f"Solution 2: {''.join(stacks_dict_2[stack][-1] for stack in stacks_dict_2)}")
+def main():
+    puzzle = Puzzle(day=5, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
@@ -71,6 +71,8 @@ How many characters need to be processed before the first start-of-message marke
 """
 import re
 
+from aoctools.inputs import Puzzle
+
 
 def compile_unique_secuence_pattern(n_chars):
     """Compile unique sequence pattern with n characters
@@ -86,15 +88,25 @@ def compile_unique_secuence_pattern(n_chars):
 START_OF_PACKET_PATTERN = compile_unique_secuence_pattern(4)
 START_OF_MESSAGE_PATTERN = compile_unique_secuence_pattern(14)
 
-if __name__ == "__main__":
 
-    with open("solutions/2022/day6/input.txt", "r") as f:
-        transmissions = [t for t in f.read().rstrip("\n").split("\n")]  # handle multi-line test input
+def part_1(input_data) -> int:
+    _, packet_start = START_OF_PACKET_PATTERN.search(input_data).span()
+    return packet_start
+
+
+def part_2(input_data) -> int:
+    _, message_start = START_OF_MESSAGE_PATTERN.search(input_data).span()
+    return message_start
+
 
-    for i, transmission in enumerate(transmissions):
-        packet_start_match = START_OF_PACKET_PATTERN.search(transmission)
-        message_start_match = START_OF_MESSAGE_PATTERN.search(transmission)
-        _, packet_start = packet_start_match.span()
-        _, message_start = message_start_match.span()
-        print(f"Start of transmission {i} at position {packet_start}")
-        print(f"Start of message {i} at position {message_start}")
+def main():
+    puzzle = Puzzle(day=6, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
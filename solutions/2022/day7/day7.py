@@ -135,6 +135,8 @@ from dataclasses import dataclass
 
 import networkx as nx
 
+from aoctools.inputs import Puzzle
+
 
 @dataclass
 class FileSystem:
@@ -206,20 +208,35 @@ def find_smallest_dir_size(fsys: FileSystem, above_size: int):
                if fsys.file_tree.nodes[node_name]['size'] > above_size)
 
 
-if __name__ == "__main__":
-
-    with open("solutions/2022/day7/input.txt", "r") as f:
-        terminal = [line for line in f.read().rstrip("\n").split("\n")]
-
-    cwd = None
+def read_filesystem(input_data: str) -> FileSystem:
+    """Replay the terminal output and compute the directory sizes"""
     fs = FileSystem(nx.DiGraph(name="Filesystem"), '/')
-    for line in terminal:
+    for line in input_data.rstrip("\n").split("\n"):
         update_filesystem(fs, line)
     fs.du()
+    return fs
+
+
+def part_1(input_data) -> int:
+    return sum_dirs_below_size(read_filesystem(input_data), max_size=100_000)
 
+
+def part_2(input_data) -> int:
+    fs = read_filesystem(input_data)
     total_space = 70_000_000
     unused_space = total_space - fs.file_tree.nodes['/']['size']
     delete_at_least = 30_000_000 - unused_space
+    return find_smallest_dir_size(fs, above_size=delete_at_least)
+
+
+def main():
+    puzzle = Puzzle(day=7, year=2022)
 
-    print(f"Solution 1: {sum_dirs_below_size(fs, max_size=100_000)}")
-    print(f"Solution 2: {find_smallest_dir_size(fs, above_size=delete_at_least)}")
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
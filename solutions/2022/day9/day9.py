@@ -3,6 +3,8 @@ https://adventofcode.com/2022/day/9
 """
 from dataclasses import dataclass
 
+from aoctools.inputs import Puzzle
+
 
 @dataclass
 class Position:
@@ -53,16 +55,31 @@ class HeadTails:
             head = tail
 
 
-if __name__ == "__main__":
+def count_tail_positions(input_data: str, n: int) -> int:
+    """Count the positions visited by the last tail of a rope with n tails"""
+    ht = HeadTails(n=n)
+    for instruction in input_data.rstrip("\n").split("\n"):
+        direction, steps = instruction.split(' ')
+        ht.move_head(direction, int(steps))
+    return len(set(ht.tail_positions[n]))
+
+
+def part_1(input_data) -> int:
+    return count_tail_positions(input_data, n=1)
+
 
-    with open("solutions/2022/day9/input.txt", "r") as f:
-        instructions = [instruction.split(' ') for instruction in f.read().rstrip("\n").split("\n")]
+def part_2(input_data) -> int:
+    return count_tail_positions(input_data, n=9)
 
-    ht_1 = HeadTails()
-    ht_10 = HeadTails(n=9)
-    for direction, steps in instructions:
-        ht_1.move_head(direction, int(steps))
-        ht_10.move_head(direction, int(steps))
 
-    print(f"Solution 1: {len(set(ht_1.tail_positions[1]))}")
-    print(f"Solution 2: {len(set(ht_10.tail_positions[9]))}")
+def main():
+    puzzle = Puzzle(day=9, year=2022)
+
+    input_data = puzzle.input_data
+    puzzle.answer_a = part_1(input_data)
+    puzzle.answer_b = part_2(input_data)
+    print(f"{puzzle.answer_a=}, {puzzle.answer_b=}")
+
+
+if __name__ == "__main__":
+    main()
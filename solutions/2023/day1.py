@@ -3,7 +3,7 @@ https://adventofcode.com/2023/day/1
 """
 import re
 
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 DIGIT_MAPPING = {
     "one": "1",
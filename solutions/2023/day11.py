@@ -3,10 +3,12 @@ https://adventofcode.com/2023/day/11
 """
 import itertools as it
 from dataclasses import dataclass
-from io import StringIO
 
 import numpy as np
-from aocd.models import Puzzle
+from aoctools.grid import lookup_table, read_grid
+from aoctools.inputs import Puzzle
+
+GALAXIES = lookup_table({"#": True}, dtype=bool)
 
 
 def min_max(*args):
@@ -31,8 +33,7 @@ class Galaxy:
 
 
 def parse_input_data(input_data, empty_distance) -> tuple[np.ndarray, np.ndarray]:
-    galaxy_str = StringIO(input_data.translate(str.maketrans(".#", "01")))
-    galaxy_arr = np.genfromtxt(galaxy_str, dtype=int, delimiter=1).astype(bool)
+    galaxy_arr = read_grid(input_data, GALAXIES)
     distance_arr = np.full_like(galaxy_arr, 1, dtype=int)
     empty_cols = np.where(np.logical_not(galaxy_arr.sum(axis=0)))[0]
     empty_rows = np.where(np.logical_not(galaxy_arr.sum(axis=1)))[0]
@@ -1,17 +1,18 @@
 """
 https://adventofcode.com/2023/day/13
 """
-import io
 from typing import Iterator
 
 import numpy as np
-from aocd.models import Puzzle
+from aoctools.grid import lookup_table, read_grid
+from aoctools.inputs import Puzzle
+
+ROCKS = lookup_table({"#": True}, dtype=bool)
 
 
 def parse_input_data(input_data) -> Iterator[np.ndarray]:
-    for pattern_str in input_data.translate(str.maketrans(".#", "01")).split("\n\n"):
-        pattern = np.genfromtxt(io.StringIO(pattern_str), delimiter=1).astype(bool)
-        yield pattern
+    for pattern_str in input_data.split("\n\n"):
+        yield read_grid(pattern_str, ROCKS)
 
 
 def find_reflection(pattern, smudge=False) -> int:
@@ -3,7 +3,7 @@ https://adventofcode.com/2023/day/2
 """
 import re
 from dataclasses import dataclass
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 @dataclass
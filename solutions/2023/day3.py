@@ -5,7 +5,7 @@ import re
 from typing import Iterator
 
 import numpy as np
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 def iter_valid_parts(
@@ -4,7 +4,7 @@ https://adventofcode.com/2023/day/4
 from collections import Counter
 from typing import Iterator
 
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 def iter_cards_winning_numbers(input_data: str) -> Iterator[tuple[set, set]]:
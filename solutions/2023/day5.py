@@ -4,7 +4,7 @@ https://adventofcode.com/2023/day/5
 
 MAP = dict[range, int]
 
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 def parse_input_data(input_data) -> tuple[list[int], dict[str, MAP]]:
@@ -5,7 +5,7 @@ import math
 from collections import namedtuple
 from typing import Iterator
 
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 RaceRecord = namedtuple("RaceRecord", ["time", "distance"])
 
@@ -5,7 +5,7 @@ from collections import Counter
 from dataclasses import dataclass, field
 from typing import Literal
 
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 CARD_HEX_TRANS_RULESET = {
@@ -7,8 +7,8 @@ from collections import namedtuple
 from typing import Iterator, Literal
 from math import lcm
 
-from aocd.models import Puzzle
-from aocd.examples import Example
+from aoctools.inputs import Puzzle
+from aoctools.inputs import Example
 
 
 NodeMap = namedtuple("NodeMap", "L,R")
@@ -6,7 +6,7 @@ from io import StringIO
 from typing import Literal
 
 import numpy as np
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 def rsub(a, b):
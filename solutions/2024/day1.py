@@ -4,7 +4,7 @@ https://adventofcode.com/2024/day/1
 from itertools import batched
 from collections import Counter
 
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 def read_input(input_data: str) -> tuple[tuple[int, ...], tuple[int, ...]]:
@@ -4,7 +4,7 @@ https://adventofcode.com/2024/day/11
 import math
 from collections import Counter
 
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 class StoneCollection:
@@ -3,7 +3,7 @@ https://adventofcode.com/2024/day/2
 """
 
 from itertools import pairwise
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 def read_input(input_data: str) -> list[list[int]]:
@@ -3,7 +3,7 @@ https://adventofcode.com/2024/day/3
 """
 import re
 from operator import mul
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 def part_1(input_data) -> int:
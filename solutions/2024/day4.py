@@ -5,7 +5,7 @@ import inspect
 from itertools import product
 from typing import Iterator
 
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 def generate_cardinal_candidates(
@@ -3,7 +3,7 @@ https://adventofcode.com/2024/day/5
 """
 from operator import itemgetter
 from itertools import groupby
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 def read_input(input_data: str) -> tuple[list[tuple[int, ...]], list[list[int]]]:
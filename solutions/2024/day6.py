@@ -4,8 +4,10 @@ https://adventofcode.com/2024/day/6
 from itertools import cycle
 
 import numpy as np
-from io import StringIO
-from aocd.models import Puzzle
+from aoctools.grid import lookup_table, read_grid
+from aoctools.inputs import Puzzle
+
+LAB = lookup_table({".": 0, "#": -1, "^": 1})
 
 
 class InfiniteLoop(Exception):
@@ -13,9 +15,7 @@ class InfiniteLoop(Exception):
 
 
 def read_input_array(input_data) -> np.ndarray:
-    int_buffer = StringIO(input_data.translate(str.maketrans({".": "0 ", "#": "-1 ", "^": "1 "})))
-    lab_arr = np.loadtxt(int_buffer, dtype=int, )
-    return lab_arr
+    return read_grid(input_data, LAB)
 
 
 def walk_pattern(lab_array: np.ndarray) -> np.ndarray:
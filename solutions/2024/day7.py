@@ -7,7 +7,7 @@ from itertools import product, chain
 from operator import add, mul, pow
 from typing import Callable
 
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 
 
 def concat(operand1: int, operand2: int) -> int:
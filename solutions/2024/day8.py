@@ -5,7 +5,8 @@ from itertools import combinations, starmap
 from collections import namedtuple
 
 import numpy as np
-from aocd.models import Puzzle
+from aoctools.grid import read_grid
+from aoctools.inputs import Puzzle
 
 DOT = ord('.')
 
@@ -44,13 +45,13 @@ def get_anti_node_mask(city: np.ndarray, limit=True) -> np.ndarray:
 
 
 def part_1(input_data) -> int:
-    city = np.array([list(map(ord, line)) for line in input_data.split("\n")])
+    city = read_grid(input_data)
     anti_node_mask = get_anti_node_mask(city)
     return np.sum(anti_node_mask).item()
 
 
 def part_2(input_data) -> int:
-    city = np.array([list(map(ord, line)) for line in input_data.split("\n")])
+    city = read_grid(input_data)
     anti_node_mask = get_anti_node_mask(city, limit=False)
     return np.sum(anti_node_mask).item()
 
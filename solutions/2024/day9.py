@@ -5,7 +5,7 @@ from itertools import repeat, zip_longest
 from operator import ge
 from typing import Iterator, Generator
 
-from aocd.models import Puzzle
+from aoctools.inputs import Puzzle
 from dataclasses import dataclass, field
 
 
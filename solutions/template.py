@@ -2,8 +2,6 @@
 https://adventofcode.com/20xx/day/x
 """
 
-from aocd.models import Puzzle
-
 
 def part_1(input_data) -> int:
     return None
@@ -14,6 +12,8 @@ def part_2(input_data) -> int:
 
 
 def main():
+    from aocd.models import Puzzle  # aocd startup is only needed to fetch and submit
+
     puzzle = Puzzle(day=None, year=None)
 
     example, = puzzle.examples